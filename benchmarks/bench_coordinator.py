@@ -0,0 +1,194 @@
+"""
+Benchmark the OreFree coordinator against a local stand-in add-on.
+
+Starts ``FakeAddon`` on a free port, drives ``OrefreeCoordinator`` against it
+inside a real (bare) Home Assistant instance and reports:
+
+- fetch latency percentiles,
+- time until entities become available, cold (empty cache) and warm,
+- event-loop blocking time measured by a lag probe,
+- timer callbacks per simulated day (refreshes, transitions, rollovers),
+  measured on a running coordinator replayed on a simulated clock.
+
+Needs Home Assistant and pytest-homeassistant-custom-component installed::
+
+    python -m benchmarks.bench_coordinator --latency 0.5 --error-rate 0.1
+"""
+
+import argparse
+import asyncio
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+
+from homeassistant.core import HomeAssistant
+from homeassistant.util import dt as dt_util
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from custom_components.orefree.auth import OrefreeAuth  # noqa: E402
+from custom_components.orefree.const import DOMAIN  # noqa: E402
+from custom_components.orefree.coordinator import (  # noqa: E402
+    create_orefree_coordinator,
+    fetch_orefree_data,
+)
+from custom_components.orefree.metrics import OrefreeMetrics  # noqa: E402
+
+from .fake_addon import FakeAddon  # noqa: E402
+from .replay import Scenario, SimulatedClock, percentile, replay  # noqa: E402
+
+LAG_PROBE_INTERVAL = 0.01
+LAG_BLOCKING_THRESHOLD = 0.01
+
+
+class LoopLagProbe:
+    """Measure how long the event loop is blocked by sleeping in small steps."""
+
+    def __init__(self, interval=LAG_PROBE_INTERVAL):
+        """Initialize the probe."""
+        self.interval = interval
+        self.max_lag = 0.0
+        self.blocked = 0.0
+        self._task = None
+
+    async def _run(self):
+        while True:
+            start = time.perf_counter()
+            await asyncio.sleep(self.interval)
+            lag = time.perf_counter() - start - self.interval
+            self.max_lag = max(self.max_lag, lag)
+            if lag > LAG_BLOCKING_THRESHOLD:
+                self.blocked += lag
+
+    def start(self):
+        self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def stop(self):
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+
+
+async def bench_fetch_latency(hass, config, requests):
+    """Return the latencies of ``requests`` sequential fetches and the failure count.
+
+    The fetches share one session token, like the fetches of a coordinator,
+    and are counted by the coordinator's metrics.
+    """
+    auth = OrefreeAuth(config["username"], config["password"])
+    metrics = OrefreeMetrics()
+    latencies = []
+    for _ in range(requests):
+        start = time.perf_counter()
+        await fetch_orefree_data(hass, config, metrics, auth)
+        latencies.append(time.perf_counter() - start)
+    return latencies, sum(metrics.failures.values())
+
+
+async def bench_availability(hass, entry, timeout):
+    """Return the seconds until the coordinator has data, or None on timeout."""
+    start = time.perf_counter()
+    coordinator = await create_orefree_coordinator(hass, entry)
+    try:
+        while not coordinator.data:
+            if time.perf_counter() - start > timeout:
+                return None
+            await asyncio.sleep(0.005)
+        return time.perf_counter() - start
+    finally:
+        await coordinator.async_shutdown()
+
+
+async def simulate_callbacks(hass, entry, schedule, days_published, days):
+    """Return the refreshes, refreshes scheduled, transitions and rollovers per day.
+
+    Replays ``days`` days of the add-on's fixed schedule through a running
+    coordinator on a simulated clock and reads its metrics.
+    """
+    first_day = dt_util.now().date()
+    scenario = Scenario.fixed(first_day, days, schedule, days_published)
+    start = datetime.combine(first_day, datetime.min.time()).replace(tzinfo=dt_util.get_default_time_zone())
+    _, coordinator, sensor = await replay(hass, entry, scenario, SimulatedClock(start), days)
+
+    metrics = coordinator.metrics
+    return (
+        metrics.wakeups["refresh"] / days,
+        metrics.refreshes_scheduled / days,
+        metrics.wakeups[sensor.entity_id] / days,
+        metrics.wakeups["rollover"] / days,
+    )
+
+
+async def run(args):
+    addon = FakeAddon(
+        args.latency, args.jitter, args.error_rate, args.malformed_rate, days=args.days_published,
+        login_latency=args.login_latency,
+    )
+    port = await addon.start()
+
+    with tempfile.TemporaryDirectory() as config_dir:
+        hass = HomeAssistant(config_dir)
+        config = {
+            "username": "bench",
+            "password": "bench",
+            "host": "127.0.0.1",
+            "port": port,
+            "timeout": args.timeout,
+        }
+        entry = MockConfigEntry(domain=DOMAIN, title="OreFree (bench)", data=config)
+
+        probe = LoopLagProbe()
+        probe.start()
+        try:
+            try:
+                latencies, failures = await bench_fetch_latency(hass, config, args.requests)
+                cold = await bench_availability(hass, entry, args.timeout)
+                warm = await bench_availability(hass, entry, args.timeout)
+            finally:
+                await probe.stop()
+            # The replay runs flat out on its own clock, outside the lag probe
+            simulated_entry = MockConfigEntry(domain=DOMAIN, title="OreFree (simulated)", data=config)
+            refreshes, scheduled, transitions, rollovers = await simulate_callbacks(
+                hass, simulated_entry, addon.schedule, args.days_published, args.simulated_days
+            )
+        finally:
+            await hass.async_stop(force=True)
+            await addon.stop()
+
+    print(f"add-on requests:          {addon.requests} ({addon.errors} injected errors, {addon.logins} logins)")
+    print(f"fetch failures:           {failures}/{args.requests}")
+    print(
+        "fetch latency (s):        "
+        f"p50={percentile(latencies, 50):.3f} p90={percentile(latencies, 90):.3f} "
+        f"p99={percentile(latencies, 99):.3f} mean={statistics.fmean(latencies):.3f}"
+    )
+    print(f"available after (s):      cold={cold if cold is None else round(cold, 3)} warm={warm if warm is None else round(warm, 3)}")
+    print(f"event loop blocked (s):   total={probe.blocked:.3f} max={probe.max_lag:.3f}")
+    print(
+        f"callbacks per day:        refreshes={refreshes:.1f} ({scheduled:.1f} scheduled) transitions={transitions:.1f} "
+        f"rollovers={rollovers:.1f} total={refreshes + transitions + rollovers:.1f}"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=50, help="sequential fetches for the latency run")
+    parser.add_argument("--latency", type=float, default=0.05)
+    parser.add_argument("--jitter", type=float, default=0.05)
+    parser.add_argument("--login-latency", type=float, default=0.0, help="seconds a website login takes")
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--malformed-rate", type=float, default=0.0)
+    parser.add_argument("--days-published", type=int, default=2)
+    parser.add_argument("--timeout", type=int, default=30)
+    parser.add_argument("--simulated-days", type=int, default=28)
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,135 @@
+"""
+Local stand-in for the OreFree scraper add-on.
+
+Serves ``/fetchHours`` like the add-on, with configurable latency, error rate
+and malformed bodies, so the integration can be exercised without the real
+website. Run it standalone with::
+
+    python -m benchmarks.fake_addon --port 8000 --latency 2 --error-rate 0.1
+"""
+
+import argparse
+import asyncio
+import random
+import secrets
+import time
+from datetime import date, timedelta
+
+from aiohttp import web
+
+DEFAULT_SCHEDULE = "10:00-13:00"
+DEFAULT_TOKEN_TTL = 3600
+
+
+class FakeAddon:
+    """aiohttp server mimicking the scraper add-on."""
+
+    def __init__(self, latency=0.0, jitter=0.0, error_rate=0.0, malformed_rate=0.0, schedule=DEFAULT_SCHEDULE, days=1, seed=None, token_ttl=DEFAULT_TOKEN_TTL, login_latency=0.0):
+        """Initialize the fake add-on."""
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.malformed_rate = malformed_rate
+        self.schedule = schedule
+        self.days = days
+        self.token_ttl = token_ttl
+        self.login_latency = login_latency
+        self.logins = 0
+        self._tokens = {}
+        self.requests = 0
+        self.errors = 0
+        self._random = random.Random(seed)
+        self._runner = None
+        self.port = None
+
+    def make_app(self):
+        """Return the aiohttp application."""
+        app = web.Application()
+        app.router.add_post("/login", self.handle_login)
+        app.router.add_get("/fetchHours", self.handle_fetch_hours)
+        return app
+
+    async def handle_login(self, request):
+        """Issue a session token, after the website login latency."""
+        body = await request.json()
+        if not body.get("username") or not body.get("password"):
+            return web.Response(status=401, text="Missing credentials")
+        if self.login_latency:
+            await asyncio.sleep(self.login_latency)
+        self.logins += 1
+        token = secrets.token_urlsafe(16)
+        self._tokens[token] = time.monotonic() + self.token_ttl
+        return web.json_response({"token": token, "expires_in": self.token_ttl})
+
+    def _authorized(self, request):
+        """Return True for a valid session token or credentials in the query string."""
+        header = request.headers.get("Authorization", "")
+        if header.startswith("Bearer "):
+            expires = self._tokens.get(header[len("Bearer "):])
+            return expires is not None and time.monotonic() < expires
+        return bool(request.query.get("username") and request.query.get("password"))
+
+    async def handle_fetch_hours(self, request):
+        """Answer like the add-on, after the configured latency."""
+        self.requests += 1
+        delay = self.latency + self._random.uniform(0, self.jitter)
+        if delay:
+            await asyncio.sleep(delay)
+
+        if not self._authorized(request):
+            return web.Response(status=401, text="Missing credentials")
+        if "Authorization" not in request.headers and self.login_latency:
+            # Without a session the website login happens on every scrape
+            await asyncio.sleep(self.login_latency)
+        if self._random.random() < self.error_rate:
+            self.errors += 1
+            return web.Response(status=500, text="Scrape failed")
+        if self._random.random() < self.malformed_rate:
+            return web.Response(text="<html>login page</html>")
+
+        days = min(int(request.query.get("days", 1)), self.days)
+        if days <= 1:
+            return web.Response(text=self.schedule)
+        today = date.today()
+        lines = [f"{(today + timedelta(days=i)).isoformat()} {self.schedule}" for i in range(days)]
+        return web.Response(text="\n".join(lines))
+
+    async def start(self, host="127.0.0.1", port=0):
+        """Start serving, port 0 picks a free port."""
+        self._runner = web.AppRunner(self.make_app())
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, host, port)
+        await site.start()
+        self.port = site._server.sockets[0].getsockname()[1]
+        return self.port
+
+    async def stop(self):
+        """Stop serving."""
+        if self._runner:
+            await self._runner.cleanup()
+            self._runner = None
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--latency", type=float, default=0.0, help="seconds before answering")
+    parser.add_argument("--jitter", type=float, default=0.0, help="extra random latency in seconds")
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--malformed-rate", type=float, default=0.0)
+    parser.add_argument("--schedule", default=DEFAULT_SCHEDULE)
+    parser.add_argument("--days", type=int, default=1, help="days published in advance")
+    parser.add_argument("--token-ttl", type=int, default=DEFAULT_TOKEN_TTL, help="session token lifetime in seconds")
+    parser.add_argument("--login-latency", type=float, default=0.0, help="seconds a website login takes")
+    args = parser.parse_args()
+
+    addon = FakeAddon(
+        args.latency, args.jitter, args.error_rate, args.malformed_rate, args.schedule, args.days,
+        token_ttl=args.token_ttl, login_latency=args.login_latency,
+    )
+    web.run_app(addon.make_app(), host=args.host, port=args.port)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,347 @@
+"""
+Replay a simulated year of OreFree schedules through the coordinator.
+
+Drives a real ``OrefreeCoordinator`` on a ``SimulatedClock``: instead of
+waiting for its refresh and rollover timers, the replay jumps the clock to
+the next target and runs the job, so a year takes seconds. The add-on is
+replaced by a scripted fetch pool answering from a seeded scenario: each
+day's windows are published the evening before, some are revised during the
+day before they lock, and the add-on has occasional outages. Reports:
+
+- fetches and failures,
+- timer wakeups per day (refreshes, rollovers, binary sensor transitions),
+- detection delay between a schedule change and the first fetch seeing it,
+  and the changes not seen before their day locked,
+- fetches after the day's lock time, and those that learned nothing new.
+
+Needs Home Assistant and pytest-homeassistant-custom-component installed::
+
+    python -m benchmarks.replay --days 365 --revision-rate 0.2 --outage-rate 0.05
+"""
+
+import argparse
+import asyncio
+import random
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+from homeassistant.core import HomeAssistant
+from homeassistant.util import dt as dt_util
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from custom_components.orefree.binary_sensor import OrefreeBinarySensor  # noqa: E402
+from custom_components.orefree.clock import SystemClock  # noqa: E402
+from custom_components.orefree.const import DEFAULT_PREFETCH_DAYS, DOMAIN  # noqa: E402
+from custom_components.orefree.coordinator import OrefreeCoordinator, build_orefree_data  # noqa: E402
+from custom_components.orefree.schedule import OrefreeSchedule  # noqa: E402
+
+
+
+def percentile(values, pct):
+    """Return the ``pct`` percentile of ``values`` (nearest rank)."""
+    ordered = sorted(values)
+    index = max(0, min(len(ordered) - 1, round(pct / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+
+class SimulatedClock(SystemClock):
+    """Clock that only moves when told to, sleeping advances it instantly."""
+
+    def __init__(self, start):
+        """Start the clock at the aware datetime ``start``."""
+        self._utc = dt_util.as_utc(start)
+        self._origin = self._utc
+
+    def now(self):
+        return dt_util.as_local(self._utc)
+
+    def naive_now(self):
+        return self.now().replace(tzinfo=None)
+
+    def monotonic(self):
+        return (self._utc - self._origin).total_seconds()
+
+    async def sleep(self, seconds):
+        self._utc += timedelta(seconds=seconds)
+        await asyncio.sleep(0)
+
+    def advance_to(self, when):
+        """Move the clock forward to the aware datetime ``when``."""
+        self._utc = max(self._utc, dt_util.as_utc(when))
+
+
+class Change:
+    """A version of a day's schedule becoming visible on the add-on."""
+
+    __slots__ = ("time", "day", "text", "deadline")
+
+    def __init__(self, when, day, text):
+        self.time = when
+        self.day = day
+        self.text = text
+        # The change is useless once the day's schedule has locked
+        self.deadline = datetime.combine(day, OrefreeSchedule.from_text(text).lock_time())
+
+
+class Scenario:
+    """Schedules, revisions and add-on outages over the simulated days, in naive local time."""
+
+    def __init__(self, changes, outages=()):
+        """Initialize from the Change list and the (start, end) outages."""
+        self.changes = sorted(changes, key=lambda change: change.time)
+        self.outages = list(outages)
+
+    @classmethod
+    def generate(cls, first_day, days, revision_rate, outage_rate, outage_hours, seed):
+        """Generate a seeded scenario of random schedules, revisions and outages."""
+        rnd = random.Random(seed)
+        changes = []
+        outages = []
+        for offset in range(-1, days + 1):
+            day = first_day + timedelta(days=offset)
+            text = cls._random_text(rnd)
+            # Published the evening before, mostly between 17:00 and 20:30
+            publish_minute = int(min(20 * 60 + 45, max(14 * 60, rnd.gauss(18.5 * 60, 60))))
+            publish = datetime.combine(day - timedelta(days=1), datetime.min.time()) + timedelta(minutes=publish_minute)
+            changes.append(Change(publish, day, text))
+
+            if rnd.random() < revision_rate:
+                revised = cls._random_text(rnd)
+                lock = min(Change(publish, day, text).deadline, Change(publish, day, revised).deadline)
+                midnight = datetime.combine(day, datetime.min.time())
+                # Revisions cluster in the morning, and always come before the lock
+                revision = midnight + timedelta(minutes=max(1, rnd.gauss(9 * 60, 90)))
+                if revision < lock:
+                    changes.append(Change(revision, day, revised))
+
+            if rnd.random() < outage_rate:
+                start = datetime.combine(day, datetime.min.time()) + timedelta(minutes=rnd.randrange(24 * 60))
+                outages.append((start, start + timedelta(hours=rnd.expovariate(1 / outage_hours))))
+
+        return cls(changes, outages)
+
+    @classmethod
+    def fixed(cls, first_day, days, text, days_published=DEFAULT_PREFETCH_DAYS):
+        """Return a scenario repeating ``text`` daily, each day known ``days_published`` days ahead."""
+        changes = []
+        for offset in range(-days_published, days + 1):
+            day = first_day + timedelta(days=offset)
+            publish = datetime.combine(day - timedelta(days=days_published - 1), datetime.min.time())
+            changes.append(Change(publish, day, text))
+        return cls(changes)
+
+    @staticmethod
+    def _random_text(rnd):
+        """Return one or two windows between 08:00 and 24:00."""
+        windows = []
+        start = 8 * 60 + rnd.randrange(0, 8) * 30
+        for _ in range(rnd.choice((1, 1, 1, 2))):
+            end = min(24 * 60, start + rnd.choice((60, 120, 180)))
+            windows.append(f"{start // 60:02d}:{start % 60:02d}-{end // 60:02d}:{end % 60:02d}")
+            start = end + 60 * rnd.randrange(1, 4)
+            if start >= 23 * 60:
+                break
+        return ",".join(windows)
+
+    def is_down(self, now):
+        """Return True if the add-on is down at ``now``."""
+        return any(start <= now < end for start, end in self.outages)
+
+    def days_at(self, now):
+        """Return the {iso date: text} the add-on answers at ``now``, today first."""
+        days = {}
+        for change in self.changes:
+            if change.time > now:
+                break
+            if 0 <= (change.day - now.date()).days < DEFAULT_PREFETCH_DAYS:
+                days[change.day.isoformat()] = change.text
+        return days
+
+    def lock_time(self, now):
+        """Return the lock time of today's schedule as known at ``now``, None if unknown."""
+        text = self.days_at(now).get(now.date().isoformat())
+        return OrefreeSchedule.from_text(text).lock_time() if text else None
+
+
+class ScriptedPool:
+    """Fetch pool answering from the scenario at the simulated time."""
+
+    def __init__(self, scenario, clock):
+        """Initialize the pool."""
+        self._scenario = scenario
+        self._clock = clock
+        self._pending = list(scenario.changes)
+        self._last_days = None
+        self.fetches = 0
+        self.failures = 0
+        self.after_lock = 0
+        self.wasted = 0
+        self.delays = []
+        self.missed = 0
+
+    async def fetch(self, hass, config, metrics=None, endpoints=None, clock=None):
+        """Answer like the add-on would at the simulated time."""
+        # Yield like a real request, so callers racing this fetch interleave
+        await asyncio.sleep(0)
+        now = self._clock.naive_now()
+        self.fetches += 1
+        self._expire(now)
+        if self._scenario.is_down(now):
+            self.failures += 1
+            if metrics is not None:
+                metrics.record_fetch(0.0, 0, ConnectionError("add-on down"))
+            return {}
+
+        days = self._scenario.days_at(now)
+        data = build_orefree_data(days, now)
+        if metrics is not None:
+            metrics.record_fetch(0.0, len(str(days)), None if data else ValueError("No schedule for today"))
+        if data is None:
+            self.failures += 1
+            return {}
+
+        # Every change visible now is detected by this fetch
+        while self._pending and self._pending[0].time <= now:
+            change = self._pending.pop(0)
+            self.delays.append((now - change.time).total_seconds())
+
+        lock = self._scenario.lock_time(now)
+        if lock is not None and now.time() > lock:
+            self.after_lock += 1
+            if days == self._last_days:
+                self.wasted += 1
+        self._last_days = days
+        return data
+
+    def _expire(self, now):
+        """Count the changes whose day locked before any fetch saw them."""
+        kept = []
+        for change in self._pending:
+            if change.time <= now and change.deadline < now:
+                self.missed += 1
+            else:
+                kept.append(change)
+        self._pending = kept
+
+
+async def replay(hass, entry, scenario, clock, days):
+    """Run ``days`` simulated days and return the pool, coordinator and binary sensor."""
+    pool = ScriptedPool(scenario, clock)
+    coordinator = OrefreeCoordinator(hass, entry, clock)
+    coordinator._fetch_pool = pool
+    end = clock.now() + timedelta(days=days)
+
+    # The binary sensor follows the coordinator as on a real install, but is
+    # not added to a platform, so it has no state to write
+    sensor = OrefreeBinarySensor(coordinator)
+    sensor.hass = hass
+    sensor.entity_id = "binary_sensor.orefree_active"
+    sensor.async_write_ha_state = lambda: None
+    unsub = coordinator.async_add_listener(sensor._handle_coordinator_update)
+
+    targets = {}
+    timers = {
+        "refresh": coordinator._refresh_timer,
+        "rollover": coordinator._rollover_timer,
+        "transition": sensor._timer,
+    }
+    jobs = {
+        "rollover": coordinator._async_rollover,
+        "transition": sensor._async_transition,
+    }
+
+    def collect():
+        # Take the targets over from the timers, the replay runs the jobs itself
+        for name, timer in timers.items():
+            if timer.target is not None:
+                targets[name] = timer.target
+                timer.cancel()
+
+    # Empty cache: the first refresh runs right away, like after a fresh install
+    await coordinator._refresh_and_reschedule()
+    collect()
+    while True:
+        name = min((name for name in targets if targets[name] is not None), key=lambda n: targets[n], default=None)
+        if name is None or targets[name] >= end:
+            break
+
+        clock.advance_to(targets[name])
+        schedule = sensor._schedule
+        if name != "transition":
+            # Re-armed from the new data, if still due
+            targets["rollover"] = None
+        if name == "refresh":
+            targets["refresh"] = None
+            coordinator._on_refresh_timer()
+            await coordinator._refresh_and_reschedule()
+        else:
+            await jobs[name]()
+        # The sensor re-arms its transition only when it ran or got a new schedule
+        if name == "transition" or sensor._schedule is not schedule:
+            targets["transition"] = None
+        collect()
+
+    unsub()
+    sensor._timer.cancel()
+    await coordinator.async_shutdown()
+    return pool, coordinator, sensor
+
+
+async def run(args):
+    dt_util.set_default_time_zone(dt_util.get_time_zone(args.time_zone))
+    first_day = datetime.strptime(args.start, "%Y-%m-%d").date()
+    scenario = Scenario.generate(first_day, args.days, args.revision_rate, args.outage_rate, args.outage_hours, args.seed)
+    start = datetime.combine(first_day, datetime.min.time()).replace(tzinfo=dt_util.get_default_time_zone())
+    clock = SimulatedClock(start)
+
+    with tempfile.TemporaryDirectory() as config_dir:
+        hass = HomeAssistant(config_dir)
+        entry = MockConfigEntry(
+            domain=DOMAIN,
+            title="OreFree (replay)",
+            data={"username": "replay", "password": "replay", "host": "127.0.0.1", "port": 8000},
+        )
+        began = time.perf_counter()
+        try:
+            pool, coordinator, sensor = await replay(hass, entry, scenario, clock, args.days)
+        finally:
+            await hass.async_stop(force=True)
+        elapsed = time.perf_counter() - began
+
+    wakeups = coordinator.metrics.wakeups
+    transitions = wakeups[sensor.entity_id]
+    delays = [delay / 60 for delay in pool.delays] or [0.0]
+    print(f"simulated days:           {args.days} in {elapsed:.1f} s ({args.time_zone}, from {first_day})")
+    print(f"schedule changes:         {len(scenario.changes)} ({len(scenario.outages)} add-on outages)")
+    print(f"fetches:                  {pool.fetches} ({pool.failures} failed, {pool.fetches / args.days:.1f} per day)")
+    print(
+        f"wakeups per day:          refreshes={wakeups['refresh'] / args.days:.1f} "
+        f"rollovers={wakeups['rollover'] / args.days:.1f} transitions={transitions / args.days:.1f}"
+    )
+    print(
+        "detection delay (min):   "
+        f"p50={percentile(delays, 50):.0f} p90={percentile(delays, 90):.0f} max={max(delays):.0f} "
+        f"missed before lock={pool.missed}"
+    )
+    print(f"fetches after lock time:  {pool.after_lock} ({pool.wasted} learned nothing new)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--days", type=int, default=365)
+    parser.add_argument("--start", default="2025-01-01", help="first simulated day, YYYY-MM-DD")
+    parser.add_argument("--time-zone", default="Europe/Rome")
+    parser.add_argument("--revision-rate", type=float, default=0.2, help="share of days revised after publishing")
+    parser.add_argument("--outage-rate", type=float, default=0.05, help="share of days with an add-on outage")
+    parser.add_argument("--outage-hours", type=float, default=2.0, help="mean outage length")
+    parser.add_argument("--seed", type=int, default=1)
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
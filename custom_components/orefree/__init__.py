@@ -3,51 +3,114 @@ Home Assistant custom component: orefree
 """
 
 import logging
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import CONF_USERNAME, CONF_PASSWORD, CONF_HOST
+from homeassistant.const import CONF_USERNAME, CONF_HOST, CONF_WEBHOOK_ID
+from homeassistant.helpers import config_validation as cv, entity_registry as er
+from homeassistant.helpers.typing import ConfigType
 
+from .const import (
+    CONF_LEAD_TIMES,
+    CONF_PORT,
+    CONF_PUSH,
+    CONF_TIMEOUT,
+    DATA_FETCH_POOL,
+    DEFAULT_HOST,
+    DEFAULT_LEAD_TIMES,
+    DEFAULT_PORT,
+    DEFAULT_TIMEOUT,
+    DOMAIN,
+    PLATFORMS,
+)
 from .coordinator import create_orefree_coordinator
+from .events import WindowEventScheduler
+from .services import async_setup_services
+from .webhook import async_register_webhook, async_unregister_webhook
 
-DOMAIN = "orefree"
-DEFAULT_HOST = "homeassistant.local"
-DEFAULT_TIMEOUT = 120
 _LOGGER = logging.getLogger(__name__)
 
+# Unique ids used before entities were scoped per config entry
+LEGACY_UNIQUE_ID_PREFIX = "orefree_"
+
+CONFIG_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)
+
+
+async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
+    """Set up the OreFree services, shared by all config entries."""
+    async_setup_services(hass)
+    return True
+
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up OreFree from a config entry."""
     hass.data.setdefault(DOMAIN, {})
-    hass.data[DOMAIN][CONF_USERNAME] = entry.data.get(CONF_USERNAME)
-    hass.data[DOMAIN][CONF_PASSWORD] = entry.data.get(CONF_PASSWORD)
-    hass.data[DOMAIN]["port"] = entry.data.get("port", 8000)
-    hass.data[DOMAIN][CONF_HOST] = entry.data.get(CONF_HOST) or DEFAULT_HOST
-    hass.data[DOMAIN]["timeout"] = entry.data.get("timeout", DEFAULT_TIMEOUT)
-    _LOGGER.debug(f"Orefree config entry setup: username={entry.data.get(CONF_USERNAME)}, host={hass.data[DOMAIN][CONF_HOST]}, port={entry.data.get('port', 8000)}, timeout={hass.data[DOMAIN]['timeout']}")
+    _LOGGER.debug(f"Orefree config entry setup: username={entry.data.get(CONF_USERNAME)}, host={entry.data.get(CONF_HOST) or DEFAULT_HOST}, port={entry.data.get(CONF_PORT, DEFAULT_PORT)}, timeout={entry.data.get(CONF_TIMEOUT, DEFAULT_TIMEOUT)}")
+
+    await _async_migrate_unique_ids(hass, entry)
+
+    # Create and store one coordinator per config entry
+    coordinator = await create_orefree_coordinator(hass, entry)
+    hass.data[DOMAIN][entry.entry_id] = coordinator
+
+    # Fire the window events from the coordinator's schedule
+    window_events = WindowEventScheduler(hass, entry, coordinator)
+    window_events.async_start()
+    entry.async_on_unload(window_events.async_stop)
+
+    async def _async_options_updated(hass: HomeAssistant, entry: ConfigEntry) -> None:
+        """Apply new options to the live coordinator and events, without a reload."""
+        await coordinator.async_apply_options(entry)
+        window_events.set_lead_times(entry.options.get(CONF_LEAD_TIMES, entry.data.get(CONF_LEAD_TIMES, DEFAULT_LEAD_TIMES)))
+
+    entry.async_on_unload(entry.add_update_listener(_async_options_updated))
 
-    # Create and store the coordinator once
-    coordinator = await create_orefree_coordinator(hass)
-    hass.data["orefree_coordinator"] = coordinator
+    # Accept schedules pushed by the add-on
+    if _push_enabled(entry):
+        async_register_webhook(hass, entry, coordinator)
 
     # Forward entry setup to platforms
-    await hass.config_entries.async_forward_entry_setups(entry, ["sensor", "binary_sensor"])
+    await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
     return True
 
 
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
+    if _push_enabled(entry):
+        async_unregister_webhook(hass, entry)
+
     # Clean up coordinator
-    coordinator = hass.data.get("orefree_coordinator")
+    coordinator = hass.data.get(DOMAIN, {}).get(entry.entry_id)
     if coordinator:
         await coordinator.async_shutdown()
-    
+
     # Unload platforms
-    unload_ok = await hass.config_entries.async_unload_platforms(entry, ["sensor", "binary_sensor"])
-    
+    unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
+
     if unload_ok:
-        # Remove data
-        hass.data.pop("orefree_coordinator", None)
-        if DOMAIN in hass.data:
+        # Remove data, and the shared state once the last account is gone
+        hass.data[DOMAIN].pop(entry.entry_id, None)
+        if not hass.data[DOMAIN]:
             hass.data.pop(DOMAIN)
-    
+            hass.data.pop(DATA_FETCH_POOL, None)
+
     return unload_ok
+
+
+def _push_enabled(entry: ConfigEntry) -> bool:
+    """Return True if the add-on pushes schedules to a webhook for this entry."""
+    return bool(entry.data.get(CONF_PUSH) and entry.data.get(CONF_WEBHOOK_ID))
+
+
+async def _async_migrate_unique_ids(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Move entities created before multi-account support to this entry's unique ids."""
+
+    @callback
+    def _migrate(entity_entry: er.RegistryEntry):
+        if not entity_entry.unique_id.startswith(LEGACY_UNIQUE_ID_PREFIX):
+            return None
+        key = entity_entry.unique_id[len(LEGACY_UNIQUE_ID_PREFIX):]
+        new_unique_id = f"{entry.entry_id}_{key}"
+        _LOGGER.info(f"Migrating orefree entity {entity_entry.entity_id} unique id to {new_unique_id}")
+        return {"new_unique_id": new_unique_id}
+
+    await er.async_migrate_entries(hass, entry.entry_id, _migrate)
@@ -0,0 +1,88 @@
+"""
+Session token handshake with the OreFree scraper add-on.
+"""
+
+import asyncio
+import logging
+import time
+
+_LOGGER = logging.getLogger(__name__)
+
+LOGIN_PATH = "/login"
+# Token lifetime assumed when the add-on does not send one
+DEFAULT_TOKEN_TTL = 3600
+# Tokens are renewed this many seconds before they expire
+TOKEN_EXPIRY_MARGIN = 60
+
+
+class OrefreeAuth:
+    """Session token of one account, shared by all its fetches.
+
+    The add-on logs in to the OreFree website once per token, so reusing the
+    token avoids a website login on every scrape. Logins are serialized so
+    concurrent fetches with an expired token only log in once. Add-ons
+    without the ``/login`` endpoint (404 or 405) are remembered as legacy,
+    and fetches fall back to credentials in the query string.
+    """
+
+    def __init__(self, username, password, clock=time.monotonic):
+        """Initialize the handshake for one account."""
+        self._username = username
+        self._password = password
+        self._clock = clock
+        self._token = None
+        self._expires = 0.0
+        self._lock = asyncio.Lock()
+        self.legacy = False
+        self.logins = 0
+
+    @property
+    def token(self):
+        """Return the cached token if it is still valid, else None."""
+        if self._token and self._clock() < self._expires - TOKEN_EXPIRY_MARGIN:
+            return self._token
+        return None
+
+    def invalidate(self, token=None):
+        """Drop the cached token, only if it is still ``token`` when given."""
+        if token is None or token == self._token:
+            self._token = None
+
+    async def async_get_token(self, session, base_url, timeout):
+        """Return a valid token, logging in if needed; None for legacy add-ons."""
+        if self.legacy:
+            return None
+        if self.token:
+            return self._token
+        async with self._lock:
+            # Another fetch may have logged in while this one waited
+            if self.token or self.legacy:
+                return self._token
+            await self._async_login(session, base_url, timeout)
+            return self._token
+
+    async def _async_login(self, session, base_url, timeout):
+        """Exchange the credentials for a session token."""
+        payload = {"username": self._username, "password": self._password}
+        async with session.post(f"{base_url}{LOGIN_PATH}", json=payload, timeout=timeout) as response:
+            if response.status in (404, 405):
+                _LOGGER.warning("OreFree add-on has no login endpoint, sending credentials with every fetch")
+                self.legacy = True
+                return
+            response.raise_for_status()
+            body = await response.json(content_type=None)
+
+        self._token = body["token"]
+        self._expires = self._clock() + float(body.get("expires_in") or DEFAULT_TOKEN_TTL)
+        self.logins += 1
+        _LOGGER.debug(f"OreFree add-on session token valid for {body.get('expires_in') or DEFAULT_TOKEN_TTL} seconds")
+
+    def as_dict(self):
+        """Return the session state without the token."""
+        remaining = self._expires - self._clock() if self._token else None
+        return {
+            "session_legacy": self.legacy,
+            "session_logins": self.logins,
+            "session_expires_in": round(remaining) if remaining is not None else None,
+        }
+
@@ -3,10 +3,12 @@ Defines orefree binary_sensor for Home Assistant.
 """
 
 import logging
-import asyncio
-from datetime import datetime, timedelta
 from homeassistant.components.binary_sensor import BinarySensorEntity
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
+from homeassistant.core import callback
+
+from .const import DOMAIN
+from .entity import OrefreeEntity
+from .timer import RefreshTimer
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -14,89 +16,88 @@ _LOGGER = logging.getLogger(__name__)
 
 # For config flow support
 async def async_setup_entry(hass, entry, async_add_entities):
-    coordinator = hass.data.get("orefree_coordinator")
+    coordinator = hass.data[DOMAIN][entry.entry_id]
     async_add_entities([
         OrefreeBinarySensor(coordinator)
     ])
 
-class OrefreeBinarySensor(CoordinatorEntity, BinarySensorEntity):
-    """OreFree binary sensor that updates every minute to check active state."""
-    
+class OrefreeBinarySensor(OrefreeEntity, BinarySensorEntity):
+    """OreFree binary sensor that flips exactly at the window starts and ends."""
+
     _attr_name = "Orefree Active"
-    _attr_unique_id = "orefree_active"
+    _key = "active"
+    _watched_keys = ("schedule",)
     _attr_icon = "mdi:clock-fast"
 
     def __init__(self, coordinator):
         """Initialize the binary sensor."""
         super().__init__(coordinator)
-        self._timer_handle = None
+        # Armed through the coordinator's clock, so a replay can drive the transitions
+        self._timer = RefreshTimer(
+            coordinator.hass, coordinator.config_entry, "transition", self._async_transition, clock=coordinator.clock
+        )
         self._is_on = False
+        self._schedule = None
 
     async def async_added_to_hass(self):
         """Called when entity is added to hass."""
         await super().async_added_to_hass()
-        # Start the minute timer
-        await self._schedule_next_minute_update()
+        # Pick up the current schedule and arm the first transition timer
+        self._schedule = self._current_schedule()
+        self._update_state_and_schedule()
 
     async def async_will_remove_from_hass(self):
         """Called when entity will be removed from hass."""
         await super().async_will_remove_from_hass()
         # Cancel the timer
-        if self._timer_handle:
-            self._timer_handle.cancel()
-            self._timer_handle = None
+        self._timer.cancel()
 
-    def _calculate_active_state(self):
-        """Calculate if OreFree is currently active based on time."""
+    @callback
+    def _handle_coordinator_update(self):
+        """Reschedule from the new schedule when the coordinator pushes a new one."""
+        if not self._data_changed():
+            return
+        self._schedule = self._current_schedule()
+        self._update_state_and_schedule()
+        super()._handle_coordinator_update()
+
+    def _current_schedule(self):
+        """Return the interval index shared by the coordinator, if any."""
         data = self.coordinator.data or {}
-        start_str = data.get("start")
-        end_str = data.get("end")
-        
-        if not start_str or not end_str:
-            return False
-        
-        try:
-            now = datetime.now().time()
-            start_time = datetime.strptime(start_str, "%H:%M").time()
-            end_time = datetime.strptime(end_str, "%H:%M").time()
-            return start_time <= now <= end_time
-        except (ValueError, TypeError) as e:
-            _LOGGER.warning(f"Failed to parse orefree time range for active state: {e}")
-            return False
-
-    async def _schedule_next_minute_update(self):
-        """Schedule the next minute update."""
-        if self._timer_handle:
-            self._timer_handle.cancel()
-        
-        # Calculate seconds until next minute
-        now = datetime.now()
-        next_minute = now.replace(second=0, microsecond=0) + timedelta(minutes=1)
-        delay = (next_minute - now).total_seconds()
-        
-        # Schedule the update
-        self._timer_handle = self.hass.loop.call_later(
-            delay,
-            lambda: asyncio.create_task(self._minute_update())
-        )
-        
-        _LOGGER.debug(f"OreFree binary sensor: next minute update in {delay:.1f} seconds")
+        return data.get("schedule")
 
-    async def _minute_update(self):
-        """Update the binary sensor state and schedule next update."""
+    def _calculate_active_state(self, now):
+        """Return (is_active, next_transition) for the current schedule at ``now``."""
+        if self._schedule is None:
+            return False, None
+        return self._schedule.is_active(now), self._schedule.next_transition(now)
+
+    @callback
+    def _update_state_and_schedule(self):
+        """Recalculate the active state and arm a single timer for the next transition."""
+        self._timer.cancel()
+
+        now = self.coordinator.clock.now()
+        self._is_on, next_transition = self._calculate_active_state(now)
+        if next_transition is None:
+            _LOGGER.debug("OreFree binary sensor: no upcoming transition scheduled")
+            return
+
+        # The timer computes the delay in UTC, so a DST change before the transition is accounted for
+        self._timer.schedule(next_transition)
+        _LOGGER.debug(f"OreFree binary sensor: next transition at {next_transition}")
+
+    async def _async_transition(self):
+        """Flip the state at a window boundary and schedule the next one."""
+        self.coordinator.metrics.record_wakeup(self.entity_id)
         old_state = self._is_on
-        self._is_on = self._calculate_active_state()
-        
+        self._update_state_and_schedule()
+
         if old_state != self._is_on:
             _LOGGER.info(f"OreFree active state changed: {old_state} -> {self._is_on}")
             self.async_write_ha_state()
-        
-        # Schedule next minute update
-        await self._schedule_next_minute_update()
 
     @property
     def is_on(self):
         """Return true if OreFree is currently active."""
-        # Always recalculate to ensure accuracy
-        self._is_on = self._calculate_active_state()
         return self._is_on
@@ -0,0 +1,65 @@
+"""
+Defines orefree calendar for Home Assistant.
+"""
+
+import logging
+from datetime import timedelta
+from homeassistant.components.calendar import CalendarEntity, CalendarEvent
+from homeassistant.util import dt as dt_util
+
+from .const import DOMAIN
+from .entity import OrefreeEntity
+
+_LOGGER = logging.getLogger(__name__)
+
+EVENT_SUMMARY = "OreFree"
+# How far ahead the calendar looks for the upcoming event
+UPCOMING_LOOKAHEAD = timedelta(days=7)
+
+
+# For config flow support
+async def async_setup_entry(hass, entry, async_add_entities):
+    """Set up the OreFree calendar."""
+    coordinator = hass.data[DOMAIN][entry.entry_id]
+    async_add_entities([
+        OrefreeCalendar(coordinator)
+    ])
+
+
+class OrefreeCalendar(OrefreeEntity, CalendarEntity):
+    """OreFree calendar with the past and prefetched windows."""
+
+    _attr_name = "Orefree"
+    _key = "calendar"
+    _watched_keys = ("days", "schedule")
+    _attr_icon = "mdi:calendar-clock"
+
+    def __init__(self, coordinator):
+        """Initialize the calendar."""
+        super().__init__(coordinator)
+
+    @property
+    def event(self):
+        """Return the current or next OreFree window."""
+        now = dt_util.now()
+        events = self._events_between(now, now + UPCOMING_LOOKAHEAD)
+        return events[0] if events else None
+
+    async def async_get_events(self, hass, start_date, end_date):
+        """Return the OreFree windows between start_date and end_date."""
+        return self._events_between(start_date, end_date)
+
+    def _events_between(self, start, end):
+        """Query the window history, which works on naive local datetimes."""
+        tz = dt_util.get_default_time_zone()
+        return [
+            CalendarEvent(
+                start=event_start.replace(tzinfo=tz),
+                end=event_end.replace(tzinfo=tz),
+                summary=EVENT_SUMMARY,
+            )
+            for event_start, event_end in self.coordinator.history.events_between(
+                dt_util.as_local(start).replace(tzinfo=None),
+                dt_util.as_local(end).replace(tzinfo=None),
+            )
+        ]
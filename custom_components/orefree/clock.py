@@ -0,0 +1,35 @@
+"""
+Clock read by the OreFree coordinator and entities.
+"""
+
+import asyncio
+import time
+
+from homeassistant.util import dt as dt_util
+
+
+class SystemClock:
+    """The real wall and monotonic clocks.
+
+    The coordinator, its timers and entities read the time only through a
+    clock, so a replay can run them against simulated time instead.
+    """
+
+    def now(self):
+        """Return the timezone-aware local time used for scheduling."""
+        return dt_util.now()
+
+    def naive_now(self):
+        """Return the naive local time used for the stored timestamps.
+
+        Local to Home Assistant's time zone like ``now``, not the system's.
+        """
+        return dt_util.now().replace(tzinfo=None)
+
+    def monotonic(self):
+        """Return the monotonic time in seconds."""
+        return time.monotonic()
+
+    async def sleep(self, seconds):
+        """Wait ``seconds``."""
+        await asyncio.sleep(seconds)
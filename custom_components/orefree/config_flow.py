@@ -1,36 +1,132 @@
 import voluptuous as vol
 from homeassistant import config_entries
-from homeassistant.const import CONF_USERNAME, CONF_PASSWORD, CONF_HOST
+from homeassistant.core import callback
+from homeassistant.components import webhook
+from homeassistant.const import CONF_USERNAME, CONF_PASSWORD, CONF_HOST, CONF_WEBHOOK_ID
 
-CONF_PORT = "port"
-CONF_TIMEOUT = "timeout"
-DEFAULT_HOST = "homeassistant.local"
-DEFAULT_TIMEOUT = 120
-
-DOMAIN = "orefree"
+from .const import (
+    CONF_CONNECT_TIMEOUT,
+    CONF_CUTOFF,
+    CONF_ENDPOINTS,
+    CONF_LEAD_TIMES,
+    CONF_LOCK_OFFSET,
+    CONF_PORT,
+    CONF_PROBE_TIMEOUT,
+    CONF_PUSH,
+    CONF_TIMEOUT,
+    DEFAULT_CONNECT_TIMEOUT,
+    DEFAULT_CUTOFF,
+    DEFAULT_HOST,
+    DEFAULT_LEAD_TIMES,
+    DEFAULT_PORT,
+    DEFAULT_PROBE_TIMEOUT,
+    DEFAULT_TIMEOUT,
+    DOMAIN,
+)
+from .endpoints import parse_endpoints
+from .events import parse_lead_times
+from .schedule import DEFAULT_LOCK_OFFSET, parse_hhmm
 
 class OreFreeConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     """Handle a config flow for OreFree."""
 
     VERSION = 1
 
+    @staticmethod
+    @callback
+    def async_get_options_flow(config_entry):
+        """Return the options flow."""
+        return OreFreeOptionsFlow()
+
     async def async_step_user(self, user_input=None):
         errors = {}
         if user_input is not None:
-            # Default host if empty
-            if not user_input.get(CONF_HOST):
-                user_input[CONF_HOST] = DEFAULT_HOST
-            return self.async_create_entry(title="OreFree", data=user_input)
+            # One entry per OreFree account
+            await self.async_set_unique_id(user_input[CONF_USERNAME].strip().lower())
+            self._abort_if_unique_id_configured()
+
+            try:
+                user_input[CONF_LEAD_TIMES] = list(parse_lead_times(user_input.get(CONF_LEAD_TIMES, DEFAULT_LEAD_TIMES)))
+            except ValueError:
+                errors[CONF_LEAD_TIMES] = "invalid_lead_times"
+            try:
+                parse_endpoints(user_input.get(CONF_ENDPOINTS, ""), user_input[CONF_PORT])
+            except ValueError:
+                errors[CONF_ENDPOINTS] = "invalid_endpoints"
+
+            if not errors:
+                # Default host if empty
+                if not user_input.get(CONF_HOST):
+                    user_input[CONF_HOST] = DEFAULT_HOST
+                # Webhook the add-on pushes schedule updates to
+                if user_input.get(CONF_PUSH):
+                    user_input[CONF_WEBHOOK_ID] = webhook.async_generate_id()
+                return self.async_create_entry(title=f"OreFree ({user_input[CONF_USERNAME]})", data=user_input)
 
         data_schema = vol.Schema({
             vol.Required(CONF_USERNAME): str,
             vol.Required(CONF_PASSWORD): str,
-            vol.Required(CONF_PORT, default=8000): int,
+            vol.Required(CONF_PORT, default=DEFAULT_PORT): int,
             vol.Optional(CONF_HOST, default=DEFAULT_HOST): str,
+            vol.Optional(CONF_ENDPOINTS, default=""): str,
             vol.Optional(CONF_TIMEOUT, default=DEFAULT_TIMEOUT): int,
+            vol.Optional(CONF_CONNECT_TIMEOUT, default=DEFAULT_CONNECT_TIMEOUT): int,
+            vol.Optional(CONF_PROBE_TIMEOUT, default=DEFAULT_PROBE_TIMEOUT): int,
+            vol.Optional(CONF_PUSH, default=False): bool,
+            vol.Optional(CONF_LEAD_TIMES, default=DEFAULT_LEAD_TIMES): str,
         })
         return self.async_show_form(
             step_id="user",
             data_schema=data_schema,
             errors=errors,
         )
+
+
+class OreFreeOptionsFlow(config_entries.OptionsFlow):
+    """Change the connection and scheduling settings of a running entry."""
+
+    async def async_step_init(self, user_input=None):
+        errors = {}
+        if user_input is not None:
+            try:
+                user_input[CONF_LEAD_TIMES] = list(parse_lead_times(user_input[CONF_LEAD_TIMES]))
+            except ValueError:
+                errors[CONF_LEAD_TIMES] = "invalid_lead_times"
+            try:
+                parse_hhmm(user_input[CONF_CUTOFF])
+            except ValueError:
+                errors[CONF_CUTOFF] = "invalid_time"
+            try:
+                parse_endpoints(user_input.get(CONF_ENDPOINTS, ""), user_input[CONF_PORT])
+            except ValueError:
+                errors[CONF_ENDPOINTS] = "invalid_endpoints"
+
+            if not errors:
+                if not user_input.get(CONF_HOST):
+                    user_input[CONF_HOST] = DEFAULT_HOST
+                # Applied to the live entry by its update listener, no reload
+                return self.async_create_entry(title="", data=user_input)
+
+        current = {**self.config_entry.data, **self.config_entry.options}
+        lead_times = current.get(CONF_LEAD_TIMES, DEFAULT_LEAD_TIMES)
+        if not isinstance(lead_times, str):
+            lead_times = ", ".join(str(minutes) for minutes in lead_times)
+
+        data_schema = vol.Schema({
+            vol.Required(CONF_PORT, default=current.get(CONF_PORT, DEFAULT_PORT)): int,
+            vol.Optional(CONF_HOST, default=current.get(CONF_HOST) or DEFAULT_HOST): str,
+            vol.Optional(CONF_ENDPOINTS, default=current.get(CONF_ENDPOINTS, "")): str,
+            vol.Optional(CONF_TIMEOUT, default=current.get(CONF_TIMEOUT, DEFAULT_TIMEOUT)): int,
+            vol.Optional(CONF_CONNECT_TIMEOUT, default=current.get(CONF_CONNECT_TIMEOUT, DEFAULT_CONNECT_TIMEOUT)): int,
+            vol.Optional(CONF_PROBE_TIMEOUT, default=current.get(CONF_PROBE_TIMEOUT, DEFAULT_PROBE_TIMEOUT)): int,
+            vol.Optional(CONF_LOCK_OFFSET, default=current.get(CONF_LOCK_OFFSET, DEFAULT_LOCK_OFFSET)): vol.All(
+                int, vol.Range(min=0, max=240)
+            ),
+            vol.Optional(CONF_CUTOFF, default=current.get(CONF_CUTOFF, DEFAULT_CUTOFF)): str,
+            vol.Optional(CONF_LEAD_TIMES, default=lead_times): str,
+        })
+        return self.async_show_form(
+            step_id="init",
+            data_schema=data_schema,
+            errors=errors,
+        )
@@ -0,0 +1,41 @@
+"""
+Constants for the orefree integration.
+"""
+
+DOMAIN = "orefree"
+PLATFORMS = ["sensor", "binary_sensor", "calendar"]
+
+CONF_PORT = "port"
+CONF_TIMEOUT = "timeout"
+CONF_CONNECT_TIMEOUT = "connect_timeout"
+CONF_PROBE_TIMEOUT = "probe_timeout"
+# Extra add-on instances as "host:port, host2:port2", fetched with hedged requests
+CONF_ENDPOINTS = "endpoints"
+
+DEFAULT_HOST = "homeassistant.local"
+DEFAULT_PORT = 8000
+# Seconds the add-on may take to answer a scrape, once connected
+DEFAULT_TIMEOUT = 120
+# Seconds to open the connection to the add-on
+DEFAULT_CONNECT_TIMEOUT = 5
+# Seconds the liveness probe run before each scrape may take
+DEFAULT_PROBE_TIMEOUT = 2
+# Days requested from the add-on in one call: today plus what is already published
+DEFAULT_PREFETCH_DAYS = 3
+
+# Maximum number of concurrent add-on fetches shared by all accounts
+DEFAULT_FETCH_CONCURRENCY = 2
+DATA_FETCH_POOL = "orefree_fetch_pool"
+
+# Push mode: the scraper add-on POSTs schedule updates to a webhook
+CONF_PUSH = "push"
+
+# Minutes before a window starts at which orefree_window_approaching is fired
+CONF_LEAD_TIMES = "lead_times"
+DEFAULT_LEAD_TIMES = "15, 60"
+
+# Scheduling options: minutes before the first window after which the day's
+# schedule is locked, and the last poll of the day as "HH:MM"
+CONF_LOCK_OFFSET = "lock_offset"
+CONF_CUTOFF = "cutoff"
+DEFAULT_CUTOFF = "20:45"
@@ -4,143 +4,535 @@ OreFree coordinator for Home Assistant.
 
 import logging
 import asyncio
+import time
 import aiohttp
-from datetime import datetime, timedelta
+from types import MappingProxyType
+from datetime import date, datetime, timedelta
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+from homeassistant.core import callback
+from homeassistant.helpers.debounce import Debouncer
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.const import CONF_USERNAME, CONF_PASSWORD, CONF_HOST, CONF_WEBHOOK_ID
+from homeassistant.helpers.storage import Store
+
+from .const import (
+    CONF_CONNECT_TIMEOUT,
+    CONF_CUTOFF,
+    CONF_ENDPOINTS,
+    CONF_LOCK_OFFSET,
+    CONF_PORT,
+    CONF_PROBE_TIMEOUT,
+    CONF_PUSH,
+    CONF_TIMEOUT,
+    DATA_FETCH_POOL,
+    DEFAULT_CONNECT_TIMEOUT,
+    DEFAULT_CUTOFF,
+    DEFAULT_FETCH_CONCURRENCY,
+    DEFAULT_HOST,
+    DEFAULT_PORT,
+    DEFAULT_PREFETCH_DAYS,
+    DEFAULT_PROBE_TIMEOUT,
+    DEFAULT_TIMEOUT,
+    DOMAIN,
+)
+from .auth import OrefreeAuth
+from .clock import SystemClock
+from .endpoints import AddonEndpoints, parse_endpoints
+from .history import WindowHistory
+from .metrics import OrefreeMetrics
+from .resilience import CircuitBreaker, backoff_delay
+from .schedule import DEFAULT_LOCK_OFFSET, OrefreeSchedule, parse_hhmm, split_days
+from .scheduler import AdaptiveRefreshPlanner
+from .stats import UsageStatistics
+from .timer import RefreshTimer
 
 _LOGGER = logging.getLogger(__name__)
 
+STORAGE_VERSION = 1
+
+# Successful fetch results younger than this are reused instead of scraping again
+FETCH_REUSE_SECONDS = 30
+# Query parameters never written to logs or diagnostics
+REDACTED_QUERY_KEYS = {"username", "password"}
+REDACTED = "**REDACTED**"
+
+# Data before the first good fetch: empty and falsy, so callers can tell it apart
+NO_DATA = MappingProxyType({})
+
+# Manual refreshes requested within this many seconds collapse into one
+MANUAL_REFRESH_COOLDOWN = 60
+
+# Retries of a failed fetch within one refresh, with exponential backoff and jitter
+FETCH_RETRIES = 2
+
+
+def build_base_url(port, host=DEFAULT_HOST):
+    """Build the base URL of the OreFree add-on."""
+    return f"http://{host}:{port}"
+
+
+def build_api_url(username, password, port, host=DEFAULT_HOST, days=1):
+    """Build the API URL for OreFree service, asking for ``days`` days starting today.
 
-def build_api_url(username, password, port, host="homeassistant.local"):
-    """Build the API URL for OreFree service."""
+    The credentials are only put in the query string for add-ons without
+    session tokens; pass None for both when authenticating with a token.
+    """
     from urllib.parse import quote
-    return f"http://{host}:{port}/fetchHours?username={quote(username)}&password={quote(password)}&type=time"
+    url = f"{build_base_url(port, host)}/fetchHours?type=time"
+    if username is not None and password is not None:
+        url += f"&username={quote(username)}&password={quote(password)}"
+    if days > 1:
+        url += f"&days={days}"
+    return url
+
+
+def parse_orefree_text(text, now, last_read=None, carry_over=0):
+    """Build the coordinator data dict from an add-on response body.
+
+    ``carry_over`` is the minutes after midnight still covered by the
+    previous day's last window. Raises ValueError if the body is not a
+    schedule, so callers keep their previous data instead of reporting "off".
+    """
+    schedule = OrefreeSchedule.from_text(text, carry_over)
+    return {
+        "text": text,
+        "start": schedule.start,
+        "end": schedule.end,
+        "schedule": schedule,
+        "on": schedule.is_active(now),
+        "last_read": last_read or now.isoformat()
+    }
+
+
+def build_orefree_data(days, now, last_read=None, carry_over=0):
+    """Build the coordinator data dict for today from a {iso date: text} horizon.
+
+    Days before today are dropped; returns None if today's schedule is
+    unknown and raises ValueError if it does not parse.
+    """
+    today = now.date().isoformat()
+    if today not in days:
+        return None
+    data = parse_orefree_text(days[today], now, last_read, carry_over)
+    data["days"] = {day: text for day, text in sorted(days.items()) if day >= today}
+    return data
+
+
+def redact_url(url):
+    """Return ``url`` with the credentials in its query string redacted."""
+    parts = urlsplit(url)
+    query = [
+        (key, REDACTED if key in REDACTED_QUERY_KEYS else value)
+        for key, value in parse_qsl(parts.query, keep_blank_values=True)
+    ]
+    return urlunsplit(parts._replace(query=urlencode(query, safe="*")))
+
 
+class AddonUnreachableError(Exception):
+    """The add-on did not answer the liveness probe."""
 
-async def fetch_orefree_data(hass):
-    """Fetch data from OreFree API."""
-    domain_data = hass.data.get("orefree", {})
-    username = domain_data.get("username")
-    password = domain_data.get("password")
-    port = domain_data.get("port", 8000)
-    host = domain_data.get("host") or "homeassistant.local"
-    timeout_seconds = domain_data.get("timeout", 120)
+
+async def probe_addon(session, base_url, timeout_seconds=DEFAULT_PROBE_TIMEOUT):
+    """Check that the add-on answers HTTP at all, within ``timeout_seconds``.
+
+    Any response, even an error status, proves the add-on is up; only
+    connection errors and timeouts count as unreachable.
+    """
+    try:
+        async with session.head(base_url, timeout=aiohttp.ClientTimeout(total=timeout_seconds)):
+            pass
+    except (aiohttp.ClientConnectionError, asyncio.TimeoutError) as e:
+        raise AddonUnreachableError(f"{base_url} unreachable: {e or type(e).__name__}") from e
+
+
+async def fetch_orefree_data(hass, config, metrics=None, auth=None, clock=None):
+    """Fetch data from OreFree API for one account's config entry data.
+
+    ``auth`` is the OrefreeAuth session with the add-on at the configured
+    host and port; without one a new session is opened for this fetch only.
+    ``clock`` tells which day the answer is for, read once it arrived.
+    """
+    username = config.get(CONF_USERNAME)
+    password = config.get(CONF_PASSWORD)
+    port = config.get(CONF_PORT, DEFAULT_PORT)
+    host = config.get(CONF_HOST) or DEFAULT_HOST
+    timeout_seconds = config.get(CONF_TIMEOUT, DEFAULT_TIMEOUT)
+    connect_timeout = config.get(CONF_CONNECT_TIMEOUT, DEFAULT_CONNECT_TIMEOUT)
+    probe_timeout = config.get(CONF_PROBE_TIMEOUT, DEFAULT_PROBE_TIMEOUT)
     
     if not username or not password:
         _LOGGER.error("Orefree username or password not set in config entry.")
         return {}
-    
-    api_url = build_api_url(username, password, port, host)
-    _LOGGER.debug(f"Fetching OreFree data from API URL: {api_url}")
-    
+    if auth is None:
+        auth = OrefreeAuth(username, password)
+    if clock is None:
+        clock = SystemClock()
+
+    start = time.perf_counter()
+    error = None
+    size = 0
+    cancelled = False
     try:
         session = async_get_clientsession(hass)
-        timeout = aiohttp.ClientTimeout(total=timeout_seconds)
-        async with session.get(api_url, timeout=timeout) as response:
-            text = await response.text()
-            try:
-                start_str, end_str = [t.strip() for t in text.split('-')]
-                now = datetime.now().time()
-                start_time = datetime.strptime(start_str, "%H:%M").time()
-                end_time = datetime.strptime(end_str, "%H:%M").time()
-                is_on = start_time <= now <= end_time
-                last_read = datetime.now().isoformat()
-                return {
-                    "text": text,
-                    "start": start_str,
-                    "end": end_str,
-                    "on": is_on,
-                    "last_read": last_read
-                }
-            except Exception as e:
-                _LOGGER.error(f"Failed to parse orefree time range: {e}")
-                return {
-                    "text": text,
-                    "start": None,
-                    "end": None,
-                    "on": False,
-                    "last_read": datetime.now().isoformat()
-                }
+        base_url = build_base_url(port, host)
+        # Fail in milliseconds when the add-on is down, before the long scrape
+        await probe_addon(session, base_url, probe_timeout)
+        timeout = aiohttp.ClientTimeout(total=None, connect=connect_timeout, sock_read=timeout_seconds)
+        # A rejected token is renewed once, then the 401 is an error
+        for attempt in range(2):
+            token = await auth.async_get_token(session, base_url, timeout)
+            if token:
+                api_url = build_api_url(None, None, port, host, DEFAULT_PREFETCH_DAYS)
+                headers = {"Authorization": f"Bearer {token}"}
+            else:
+                api_url = build_api_url(username, password, port, host, DEFAULT_PREFETCH_DAYS)
+                headers = None
+            _LOGGER.debug(f"Fetching OreFree data from API URL: {redact_url(api_url)}")
+
+            async with session.get(api_url, headers=headers, timeout=timeout) as response:
+                if response.status == 401 and token and attempt == 0:
+                    _LOGGER.info("OreFree add-on rejected the session token, logging in again")
+                    auth.invalidate(token)
+                    continue
+                # An error page is not a schedule, whatever its body says
+                response.raise_for_status()
+                text = await response.text()
+                size = len(text.encode())
+                now = clock.naive_now()
+                try:
+                    data = build_orefree_data(split_days(text, now.date()), now)
+                except ValueError as e:
+                    _LOGGER.error(f"OreFree response is not a schedule ({e}): {text}")
+                    error = e
+                    return {}
+                if data is None:
+                    _LOGGER.error(f"OreFree response has no schedule for today: {text}")
+                    error = ValueError("No schedule for today")
+                    return {}
+                return data
     except asyncio.CancelledError:
+        # A hedged request that lost the race, not an answer to record
+        cancelled = True
         raise
+    except AddonUnreachableError as e:
+        error = e
+        _LOGGER.error(f"OreFree add-on is not reachable, skipping the scrape: {e}")
+        return {}
+    except aiohttp.ClientResponseError as e:
+        error = e
+        # str(e) carries the request URL, with the credentials of legacy add-ons
+        _LOGGER.error(
+            f"Failed to fetch orefree data from {redact_url(str(e.request_info.real_url))}: {e.status} {e.message}"
+        )
+        return {}
     except (aiohttp.ClientError) as e:
+        error = e
         _LOGGER.error(f"Failed to fetch orefree data from {host}:{port}: {e}")
         return {}
     except (asyncio.TimeoutError) as e:
+        error = e
         _LOGGER.error(f"Failed to fetch orefree data from {host}:{port}: {e}")
         return {}
     except Exception as e:
+        error = e
         _LOGGER.error(f"Unexpected error fetching orefree data: {e}")
         return {}
+    finally:
+        if metrics is not None and not cancelled:
+            metrics.record_fetch(time.perf_counter() - start, size, error)
+
+
+class OrefreeFetchPool:
+    """Concurrency-limited pool shared by the coordinators of all accounts.
+
+    Scheduled refreshes of every account fire on the same grid, so without
+    the pool N accounts would hit the add-on at the same instant.
+    """
+
+    def __init__(self, limit=DEFAULT_FETCH_CONCURRENCY):
+        """Initialize the pool."""
+        self._semaphore = asyncio.Semaphore(limit)
+
+    async def fetch(self, hass, config, metrics=None, endpoints=None, clock=None):
+        """Fetch OreFree data once a pool slot is free, hedged over ``endpoints`` if given."""
+        async with self._semaphore:
+            if endpoints is None:
+                return await fetch_orefree_data(hass, config, metrics, clock=clock)
+            return await endpoints.fetch(fetch_orefree_data, hass, config, metrics, clock)
+
+
+def get_fetch_pool(hass):
+    """Return the fetch pool shared by all OreFree config entries."""
+    pool = hass.data.get(DATA_FETCH_POOL)
+    if pool is None:
+        pool = hass.data[DATA_FETCH_POOL] = OrefreeFetchPool()
+    return pool
 
 
 class OrefreeCoordinator(DataUpdateCoordinator):
-    """OreFree data update coordinator."""
+    """OreFree data update coordinator for one account."""
 
-    def __init__(self, hass):
-        """Initialize the coordinator."""
+    def __init__(self, hass, entry, clock=None):
+        """Initialize the coordinator, ``clock`` defaults to the system clock."""
         super().__init__(
             hass,
             _LOGGER,
-            name="orefree_coordinator",
+            name=f"orefree_coordinator_{entry.data.get(CONF_USERNAME)}",
             update_interval=None,
+            config_entry=entry,
         )
+        self.clock = clock or SystemClock()
+        self._config = {**entry.data, **entry.options}
+        self._push = bool(entry.data.get(CONF_PUSH) and entry.data.get(CONF_WEBHOOK_ID))
+        self._fetch_pool = get_fetch_pool(hass)
+        self._endpoints = self._build_endpoints()
         self._next_refresh = None
-        self._timer_handle = None
+        self._refresh_timer = RefreshTimer(
+            hass, entry, "refresh", self._refresh_and_reschedule, self._on_refresh_timer, self.clock
+        )
+        self._rollover_timer = RefreshTimer(hass, entry, "rollover", self._async_rollover, clock=self.clock)
+        self._manual_refresh = Debouncer(
+            hass, _LOGGER, cooldown=MANUAL_REFRESH_COOLDOWN, immediate=True, function=self.force_refresh_now
+        )
+        self._inflight_fetch = None
+        self._last_fetch = None
+        self._last_fetch_time = None
+        self._planner = AdaptiveRefreshPlanner(**self._planner_settings())
+        self._history = WindowHistory()
+        self._stats = UsageStatistics()
+        self._breaker = CircuitBreaker(clock=self.clock.monotonic)
+        self.metrics = OrefreeMetrics()
+        self._store = Store(hass, STORAGE_VERSION, f"{DOMAIN}.{entry.entry_id}.cache")
+        self._published = None
+        self._published_success = None
+        # Keys that changed in the last published snapshot, None means all
+        self.changed_keys = None
+
+    def _snapshot(self, data, **changes):
+        """Return an immutable snapshot of ``data`` with ``changes`` and the breaker state applied."""
+        return MappingProxyType({**data, **changes, "circuit": self._breaker.state})
+
+    @callback
+    def async_update_listeners(self):
+        """Notify the listeners only if the snapshot differs from the last published one.
+
+        ``changed_keys`` tells the entities which fields changed, so each of
+        them writes its state only when one of its own fields did.
+        """
+        current = self.data or {}
+        previous = self._published
+        if previous is None or self.last_update_success != self._published_success:
+            self.changed_keys = None
+        else:
+            self.changed_keys = frozenset(
+                key for key in previous.keys() | current.keys()
+                if previous.get(key) != current.get(key)
+            )
+            if not self.changed_keys:
+                _LOGGER.debug("OreFree data unchanged, not notifying entities")
+                return
+
+        self._published = current
+        self._published_success = self.last_update_success
+        super().async_update_listeners()
 
     async def _async_update_data(self):
         """Update data via API endpoint."""
         try:
-            new_data = await fetch_orefree_data(self.hass)
+            new_data = await self._async_fetch()
             
             # If fetch failed or returned empty/invalid, keep previous data
             if not new_data or new_data.get("text") is None:
                 _LOGGER.warning("Keeping previous orefree data due to fetch error or invalid response.")
                 if hasattr(self, "data") and self.data:
-                    prev_data = dict(self.data)
                     if self._next_refresh:
-                        prev_data["next_refresh"] = self._next_refresh
-                    return prev_data
-                return {}
+                        return self._snapshot(self.data, next_refresh=self._next_refresh)
+                    return self._snapshot(self.data)
+                return NO_DATA
             
+            new_data = self._with_carry_over(new_data)
+
+            # Learn when schedules change and persist the last good payload
+            self._planner.record_fetch(self.clock.naive_now(), new_data["text"])
+            self._record_history(new_data)
+            await self._async_save_cache(new_data)
+
             # Calculate next refresh if not already set
             if self._next_refresh is None:
                 _LOGGER.info("Next refresh not set, calculating now...")
                 await self._schedule_next_refresh(new_data.get("on", False))
             
             # Always add next_refresh to the data
-            new_data["next_refresh"] = self._next_refresh or "Not scheduled"
-            _LOGGER.info(f"Returning data with next_refresh: {new_data['next_refresh']}")
-                
-            return new_data
+            _LOGGER.info(f"Returning data with next_refresh: {self._next_refresh or 'Not scheduled'}")
+            return self._snapshot(new_data, next_refresh=self._next_refresh or "Not scheduled")
             
         except Exception as err:
             _LOGGER.error(f"Error fetching orefree data: {err}")
             # Keep previous data on error
             if hasattr(self, "data") and self.data:
-                prev_data = dict(self.data)
                 if self._next_refresh:
-                    prev_data["next_refresh"] = self._next_refresh
-                return prev_data
-            return {}
+                    return self._snapshot(self.data, next_refresh=self._next_refresh)
+                return self._snapshot(self.data)
+            return NO_DATA
+
+    async def _async_fetch(self):
+        """Fetch OreFree data, coalescing concurrent and back-to-back callers.
+
+        Callers arriving while a scrape is running await the same in-flight
+        task, and a successful result is reused for FETCH_REUSE_SECONDS.
+        Every caller gets its own copy of the result dict.
+        """
+        if (self._last_fetch is not None and
+                self.clock.monotonic() - self._last_fetch_time < FETCH_REUSE_SECONDS):
+            _LOGGER.debug("Reusing orefree data fetched moments ago")
+            return dict(self._last_fetch)
+
+        task = self._inflight_fetch
+        if task is None or task.done():
+            # Eager tasks may already be done here, so the slot is cleared by
+            # a done callback that runs after this assignment, never by the task
+            task = self._inflight_fetch = self.config_entry.async_create_background_task(
+                self.hass, self._async_fetch_once(), f"orefree fetch {self.config_entry.entry_id}"
+            )
+            task.add_done_callback(self._clear_inflight_fetch)
+        else:
+            _LOGGER.debug("Joining in-flight orefree fetch")
+
+        # Shield so a cancelled caller does not cancel the fetch for the others
+        result = await asyncio.shield(task)
+        return dict(result)
+
+    @callback
+    def _clear_inflight_fetch(self, task):
+        """Free the in-flight slot once ``task`` is done, unless it was replaced."""
+        if self._inflight_fetch is task:
+            self._inflight_fetch = None
+
+    async def _async_fetch_once(self):
+        """Run a single fetch through the shared pool and remember good results.
+
+        Failed attempts are retried up to FETCH_RETRIES times with backoff.
+        While the circuit breaker is open no request is sent at all.
+        """
+        for attempt in range(FETCH_RETRIES + 1):
+            if not self._breaker.allow_request():
+                _LOGGER.warning(f"OreFree circuit breaker open, skipping fetch (retry in {self._breaker.retry_in():.0f} seconds)")
+                return {}
+
+            result = await self._fetch_pool.fetch(
+                self.hass, self._config, self.metrics, self._endpoints, self.clock
+            )
+            if result and result.get("text") is not None:
+                self._breaker.record_success()
+                self._last_fetch = result
+                self._last_fetch_time = self.clock.monotonic()
+                return result
+
+            self._breaker.record_failure()
+            if attempt < FETCH_RETRIES:
+                delay = backoff_delay(attempt)
+                _LOGGER.info(f"OreFree fetch failed, retry {attempt + 1}/{FETCH_RETRIES} in {delay:.1f} seconds")
+                await self.clock.sleep(delay)
+        return {}
+
+    def _endpoint_addresses(self):
+        """Return the (host, port) of the main add-on followed by the extra ones."""
+        port = self._config.get(CONF_PORT, DEFAULT_PORT)
+        addresses = [(self._config.get(CONF_HOST) or DEFAULT_HOST, port)]
+        for address in parse_endpoints(self._config.get(CONF_ENDPOINTS, ""), port):
+            if address not in addresses:
+                addresses.append(address)
+        return addresses
+
+    def _build_endpoints(self):
+        """Return the add-on endpoints with a fresh session and failure streak each."""
+        return AddonEndpoints(
+            self._endpoint_addresses(),
+            self._config.get(CONF_USERNAME),
+            self._config.get(CONF_PASSWORD),
+            self.clock.monotonic,
+        )
+
+    def _planner_settings(self):
+        """Return the planner cutoff and lock offset from the entry options."""
+        cutoff = parse_hhmm(self._config.get(CONF_CUTOFF, DEFAULT_CUTOFF))
+        return {
+            "cutoff": divmod(cutoff, 60),
+            "lock_offset": self._config.get(CONF_LOCK_OFFSET, DEFAULT_LOCK_OFFSET),
+        }
+
+    async def async_apply_options(self, entry):
+        """Apply changed options to the running coordinator, keeping its data.
+
+        Timeouts are read on every fetch and apply from the next one. New
+        add-on endpoints get fresh sessions and a fresh circuit breaker, as
+        the old ones belong to other add-ons. The next refresh is replanned
+        with the new scheduling settings, without calling the add-on.
+        """
+        self._config = {**entry.data, **entry.options}
+        addresses = self._endpoint_addresses()
+        if addresses != self._endpoints.addresses:
+            _LOGGER.info(f"OreFree add-on endpoints changed to {', '.join(f'{host}:{port}' for host, port in addresses)}")
+            self._endpoints = self._build_endpoints()
+            self._breaker = CircuitBreaker(clock=self.clock.monotonic)
+            self._last_fetch = None
+
+        settings = self._planner_settings()
+        self._planner.cutoff = settings["cutoff"]
+        self._planner.lock_offset = settings["lock_offset"]
+
+        await self.schedule_refresh()
+        if self.data:
+            self.async_set_updated_data(self._snapshot(self.data, next_refresh=self._next_refresh))
+
+    @property
+    def breaker(self):
+        """Return the circuit breaker guarding the add-on."""
+        return self._breaker
+
+    @property
+    def endpoints(self):
+        """Return the add-on endpoints of the account."""
+        return self._endpoints
+
+    @property
+    def statistics(self):
+        """Return the running usage statistics."""
+        return self._stats
+
+    @property
+    def history(self):
+        """Return the date-indexed window history."""
+        return self._history
+
+    @property
+    def planner(self):
+        """Return the adaptive refresh planner."""
+        return self._planner
 
     async def _schedule_next_refresh(self, is_currently_active):
         """Schedule the next refresh based on current state and time."""
-        # Cancel any existing scheduled update
-        if self._timer_handle:
-            self._timer_handle.cancel()
-            self._timer_handle = None
-        
-        if is_currently_active:
-            # If orefree is active, schedule next refresh for tomorrow 00:00:30
-            tomorrow = datetime.now() + timedelta(days=1)
+        if is_currently_active and self._day_known(self.clock.now().date() + timedelta(days=1)):
+            # If orefree is active and tomorrow is known, schedule next refresh for tomorrow 00:00:30
+            tomorrow = self.clock.now() + timedelta(days=1)
             next_refresh = tomorrow.replace(hour=0, minute=0, second=30, microsecond=0)
             _LOGGER.info(f"OreFree is active, next refresh scheduled for {next_refresh}")
         else:
             # If not active, use the regular scheduling logic with start time check
             next_refresh = self._calculate_next_refresh_time()
             _LOGGER.info(f"OreFree is inactive, next refresh scheduled for {next_refresh}")
+
+        # No need to scrape at the start of a day that was already prefetched
+        next_refresh = self._skip_prefetched_day_start(next_refresh)
+
+        # While the add-on is failing, probe again as soon as the breaker allows
+        retry_in = self._breaker.retry_in()
+        if retry_in:
+            probe_at = self.clock.now() + timedelta(seconds=retry_in)
+            if probe_at < next_refresh:
+                next_refresh = probe_at
+                _LOGGER.info(f"OreFree circuit breaker open, probing at {next_refresh}")
         
         old_next_refresh = self._next_refresh
         self._next_refresh = next_refresh.isoformat()
@@ -149,62 +541,92 @@ class OrefreeCoordinator(DataUpdateCoordinator):
         if old_next_refresh != self._next_refresh:
             _LOGGER.info(f"Next refresh time updated from {old_next_refresh} to {self._next_refresh}")
         
-        # Schedule the refresh
-        delay = (next_refresh - datetime.now()).total_seconds()
-        if delay > 0:
-            self._timer_handle = self.hass.loop.call_later(
-                delay, 
-                lambda: asyncio.create_task(self._refresh_and_reschedule())
-            )
-            _LOGGER.info(f"Refresh scheduled in {delay:.1f} seconds")
-        else:
-            # If the calculated time is in the past, schedule for immediate refresh
-            self._timer_handle = self.hass.loop.call_soon(
-                lambda: asyncio.create_task(self._refresh_and_reschedule())
+        # Schedule the refresh, a time in the past runs it immediately
+        self.metrics.refreshes_scheduled += 1
+        self._refresh_timer.schedule(next_refresh)
+
+        self._arm_rollover()
+
+    @callback
+    def _on_refresh_timer(self):
+        """Count the scheduled refresh timer firing."""
+        self.metrics.record_wakeup("refresh")
+        self.metrics.refreshes_executed += 1
+
+    def _skip_prefetched_day_start(self, next_refresh):
+        """Move a 00:00:30 refresh to the day's next poll if that day is already known."""
+        days = (self.data or {}).get("days") or {}
+        day = next_refresh.date().isoformat()
+        if self._push or next_refresh.hour or next_refresh.minute or day not in days:
+            return next_refresh
+
+        try:
+            schedule = OrefreeSchedule.from_text(days[day])
+        except ValueError:
+            schedule = None
+        next_poll = self._planner.next_refresh_time(
+            next_refresh, schedule, tomorrow_known=self._day_known(next_refresh.date() + timedelta(days=1))
+        )
+        _LOGGER.info(f"OreFree schedule for {day} already prefetched, skipping the {next_refresh} refresh, next poll at {next_poll}")
+        return next_poll
+
+    def _day_known(self, day):
+        """Return True if the schedule of ``day`` is already in the data."""
+        return day.isoformat() in ((self.data or {}).get("days") or {})
+
+    def _arm_rollover(self):
+        """Arm a timer at the next midnight if tomorrow's schedule is already known."""
+        self._rollover_timer.cancel()
+
+        now = self.clock.now()
+        midnight = (now + timedelta(days=1)).replace(hour=0, minute=0, second=0, microsecond=0)
+        days = (self.data or {}).get("days") or {}
+        if midnight.date().isoformat() not in days:
+            return
+
+        self._rollover_timer.schedule(midnight)
+        _LOGGER.debug(f"OreFree midnight rollover armed for {midnight}")
+
+    async def _async_rollover(self):
+        """Switch to the prefetched schedule of the new day without a network round trip."""
+        self.metrics.record_wakeup("rollover")
+        if not self.data:
+            return
+
+        now = self.clock.naive_now()
+        try:
+            new_data = build_orefree_data(
+                self.data.get("days") or {}, now, self.data.get("last_read"), self._carry_over(now)
             )
-            _LOGGER.info("Scheduling immediate refresh")
+        except ValueError as e:
+            _LOGGER.warning(f"Prefetched orefree schedule for {now.date()} does not parse, waiting for a fetch: {e}")
+            return
+        if new_data is None:
+            return
+
+        _LOGGER.info(f"OreFree rolled over to prefetched schedule for {now.date()}: {new_data['text']}")
+        self._planner.seed(now, new_data["text"])
+        self._stats.update(now.date(), new_data["schedule"])
+        self.async_set_updated_data(self._snapshot(new_data, next_refresh=self._next_refresh or "Not scheduled"))
+        self._arm_rollover()
 
     def _calculate_next_refresh_time(self):
-        """Calculate the next refresh time based on current time and start time (locked 15 min before start)."""
-        now = datetime.now()
-        
-        # If before 00:00:30, schedule for 00:00:30 today
-        if now.hour == 0 and (now.minute < 1 or (now.minute == 0 and now.second < 30)):
-            return now.replace(hour=0, minute=0, second=30, microsecond=0)
-        
-        # If we have start time and current time is after (start time - 15 minutes) but before 20:45, 
-        # schedule for next day 00:00:30 (schedule is locked 15 minutes before start time)
-        if hasattr(self, "data") and self.data:
-            start_time_str = self.data.get("start")
-            if start_time_str:
-                try:
-                    start_time = datetime.strptime(start_time_str, "%H:%M").time()
-                    # Calculate start time minus 15 minutes (schedule lock time)
-                    start_datetime = datetime.combine(now.date(), start_time)
-                    lock_time = (start_datetime - timedelta(minutes=15)).time()
-                    current_time = now.time()
-                    
-                    # If current time is after lock time (start - 15 min) and before 20:45, go to next day
-                    # (no point checking again today as schedule is already locked)
-                    if (current_time > lock_time and 
-                        (now.hour < 20 or (now.hour == 20 and now.minute < 45))):
-                        tomorrow = now + timedelta(days=1)
-                        _LOGGER.info(f"Current time {current_time} is after OreFree lock time {lock_time} (start {start_time} - 15 min) and before 20:45, scheduling for next day (schedule locked)")
-                        return tomorrow.replace(hour=0, minute=0, second=30, microsecond=0)
-                except (ValueError, TypeError) as e:
-                    _LOGGER.warning(f"Failed to parse start time '{start_time_str}': {e}")
-        
-        # Find next :45:30 after current hour, or next 00:00:30 if after 20:45:30
-        if now.hour < 20 or (now.hour == 20 and (now.minute < 45 or (now.minute == 45 and now.second < 30))):
-            # Next :45:30 in current or next hour
-            if now.minute < 45 or (now.minute == 45 and now.second < 30):
-                return now.replace(minute=45, second=30, microsecond=0)
-            else:
-                return (now + timedelta(hours=1)).replace(minute=45, second=30, microsecond=0)
-        else:
-            # After 20:45:30, schedule for next day's 00:00:30
-            tomorrow = now + timedelta(days=1)
-            return tomorrow.replace(hour=0, minute=0, second=30, microsecond=0)
+        """Calculate the next refresh time from the adaptive planner (no polls after the schedule lock time)."""
+        now = self.clock.now()
+
+        # In push mode the add-on sends updates, poll only once a day as a safety net
+        if self._push:
+            next_refresh = now.replace(hour=0, minute=0, second=30, microsecond=0)
+            if next_refresh <= now:
+                next_refresh += timedelta(days=1)
+            _LOGGER.info(f"OreFree push mode, next safety-net refresh at {next_refresh}")
+            return next_refresh
+
+        schedule = self.data.get("schedule") if self.data else None
+        # Past today's lock the polls go on only to pick up tomorrow's schedule
+        return self._planner.next_refresh_time(
+            now, schedule, tomorrow_known=self._day_known(now.date() + timedelta(days=1))
+        )
 
     async def schedule_refresh(self):
         """Schedule the next refresh based on the refresh logic."""
@@ -219,53 +641,172 @@ class OrefreeCoordinator(DataUpdateCoordinator):
     async def _refresh_and_reschedule(self):
         """Refresh data and reschedule next refresh."""
         _LOGGER.info("Executing scheduled refresh...")
-        await self.async_request_refresh()
-        # After refresh, we need to check the new state and reschedule
-        if self.data:
-            await self._schedule_next_refresh(self.data.get("on", False))
-            # Force update the data with the new next_refresh time
-            if self._next_refresh and self.data:
-                self.data["next_refresh"] = self._next_refresh
-                # Notify listeners that data has changed
-                self.async_set_updated_data(self.data)
+        # Not debounced: the timer already runs one refresh at a time
+        await self.async_refresh()
+        # After refresh, we need to check the new state and reschedule, also
+        # when the fetch failed so a probe is scheduled once the breaker allows
+        await self._schedule_next_refresh(bool(self.data and self.data.get("on", False)))
+        if self.data and self._next_refresh:
+            # Publish a new snapshot with the new next_refresh time
+            self.async_set_updated_data(self._snapshot(self.data, next_refresh=self._next_refresh))
 
     async def async_setup(self):
         """Set up the coordinator.
 
-        The initial data fetch is performed in the background so that a slow or
-        unreachable endpoint does not block (and get cancelled with) the config
-        entry setup. Entities will report as unavailable until the first
-        successful refresh completes.
+        The last good payload is loaded from disk first, so entities are
+        available immediately after a restart. The add-on is only called again
+        (by the refresh timer in the background, so a slow or unreachable
+        endpoint does not block the config entry setup) when the cached day is
+        stale or was read before today's schedule locked; otherwise only the
+        next refresh is scheduled.
         """
-        self.hass.async_create_task(self._async_initial_refresh())
+        if await self._async_load_cache():
+            schedule = self.data.get("schedule")
+            last_read = self.data.get("last_read")
+            if schedule is not None and last_read:
+                # A payload read before the lock may have been revised while we were down
+                lock = datetime.combine(self.clock.naive_now().date(), schedule.lock_time(self._planner.lock_offset))
+                if datetime.fromisoformat(last_read) > lock:
+                    _LOGGER.info("Using cached orefree data, it was read after today's schedule locked")
+                    await self._async_schedule_from_cache()
+                    return
 
-    async def _async_initial_refresh(self):
-        """Perform the first refresh and schedule the next one in the background."""
-        # Perform initial refresh (does not raise; failures keep empty data)
-        await self.async_refresh()
+        self._refresh_timer.schedule(self.clock.now())
 
-        # Schedule the next refresh (this should set _next_refresh)
-        await self.schedule_refresh()
+    async def _async_load_cache(self):
+        """Load the planner history and today's cached payload into the coordinator data.
+
+        Returns True if a payload for today was found.
+        """
+        cached = await self._store.async_load()
+        if not cached:
+            return False
+
+        planner_state = cached.get("planner") or {}
+        self._planner = AdaptiveRefreshPlanner(
+            planner_state.get("changes", ()),
+            planner_state.get("days_observed", 0),
+            **self._planner_settings(),
+        )
+        self._history = WindowHistory.from_dict(cached.get("history"))
+        self._stats = UsageStatistics.from_dict(cached.get("statistics"))
+        if not cached.get("text"):
+            return False
 
-        # If we have data, update it with the next refresh time
+        now = self.clock.naive_now()
+        days = cached.get("days") or {cached.get("date"): cached["text"]}
+        try:
+            data = build_orefree_data(days, now, cached.get("last_read"), self._carry_over(now))
+        except ValueError as e:
+            _LOGGER.warning(f"Cached orefree data does not parse, revalidating: {e}")
+            return False
+        if data is None:
+            _LOGGER.info(f"Cached orefree data from {cached.get('date')} is stale, revalidating")
+            return False
+
+        self.data = self._snapshot(data)
+        self._planner.seed(now, data["text"])
+        self._stats.update(now.date(), data["schedule"])
+        _LOGGER.debug(f"Loaded cached orefree data: {self.data}")
+        return True
+
+    async def _async_save_cache(self, data):
+        """Save the last good payload to disk."""
+        await self._store.async_save({
+            "date": self.clock.naive_now().date().isoformat(),
+            "text": data["text"],
+            "days": data.get("days"),
+            "last_read": data.get("last_read"),
+            "planner": self._planner.as_dict(),
+            "history": self._history.as_dict(),
+            "statistics": self._stats.as_dict(),
+        })
+
+    def _record_history(self, data):
+        """Add the fetched days to the window history and today's window to the statistics."""
+        today = self.clock.naive_now().date()
+        self._stats.update(today, data.get("schedule"))
+        for day, text in (data.get("days") or {}).items():
+            day = date.fromisoformat(day)
+            if day == today:
+                schedule = data.get("schedule")
+            else:
+                try:
+                    schedule = OrefreeSchedule.from_text(text)
+                except ValueError:
+                    schedule = None
+            self._history.add(day, schedule)
+
+    def _carry_over(self, now):
+        """Return the minutes of today still covered by yesterday's last window."""
+        return self._history.spill_over(now.date() - timedelta(days=1))
+
+    def _with_carry_over(self, data):
+        """Return fetched data with yesterday's spill-over carried into today's schedule."""
+        now = self.clock.naive_now()
+        schedule = data["schedule"]
+        carry_over = self._carry_over(now)
+        if schedule.carry_over == carry_over:
+            return data
+        schedule = OrefreeSchedule(schedule.windows, carry_over)
+        return {**data, "schedule": schedule, "on": schedule.is_active(now)}
+
+    async def _async_schedule_from_cache(self):
+        """Schedule the next refresh for cached data without calling the add-on."""
+        await self.schedule_refresh()
         if self.data and self._next_refresh:
-            self.data["next_refresh"] = self._next_refresh
-            self.async_set_updated_data(self.data)
+            self.async_set_updated_data(self._snapshot(self.data, next_refresh=self._next_refresh))
+
+    async def async_handle_push(self, text):
+        """Apply a schedule pushed by the add-on without scraping.
+
+        Returns False, keeping the current data, if the text is not a
+        schedule for today.
+        """
+        now = self.clock.naive_now()
+        try:
+            new_data = build_orefree_data(split_days(text, now.date()), now, carry_over=self._carry_over(now))
+        except ValueError as e:
+            _LOGGER.warning(f"Ignoring pushed orefree schedule that does not parse ({e}): {text}")
+            return False
+        if new_data is None:
+            _LOGGER.warning(f"Ignoring pushed orefree schedule without today: {text}")
+            return False
+        _LOGGER.info(f"Applying pushed orefree schedule: {text}")
+
+        # Pushed data counts as a fresh fetch for coalescing purposes
+        self._last_fetch = dict(new_data)
+        self._last_fetch_time = self.clock.monotonic()
+        self._planner.record_fetch(self.clock.naive_now(), new_data["text"])
+        self._record_history(new_data)
+        await self._async_save_cache(new_data)
+
+        self.async_set_updated_data(self._snapshot(new_data, next_refresh=self._next_refresh or "Not scheduled"))
+        self._arm_rollover()
+        return True
 
     async def force_refresh_now(self):
         """Force an immediate refresh for testing."""
         _LOGGER.info("Forcing immediate refresh...")
-        await self._refresh_and_reschedule()
+        await self._refresh_timer.async_run_now()
+
+    async def async_request_manual_refresh(self):
+        """Refresh now, or once at the end of the cooldown if one just ran."""
+        await self._manual_refresh.async_call()
 
     async def async_shutdown(self):
         """Clean up coordinator resources."""
-        if self._timer_handle:
-            self._timer_handle.cancel()
-            self._timer_handle = None
+        self._manual_refresh.async_shutdown()
+        await self._refresh_timer.async_shutdown()
+        await self._rollover_timer.async_shutdown()
+        if self._inflight_fetch:
+            self._inflight_fetch.cancel()
+            self._inflight_fetch = None
+        await super().async_shutdown()
 
 
-async def create_orefree_coordinator(hass):
-    """Create and set up the OreFree coordinator."""
-    coordinator = OrefreeCoordinator(hass)
+async def create_orefree_coordinator(hass, entry, clock=None):
+    """Create and set up the OreFree coordinator for a config entry."""
+    coordinator = OrefreeCoordinator(hass, entry, clock)
     await coordinator.async_setup()
     return coordinator
@@ -0,0 +1,30 @@
+"""
+Diagnostics support for OreFree.
+"""
+
+from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.const import CONF_PASSWORD, CONF_USERNAME, CONF_WEBHOOK_ID
+
+from .const import DOMAIN
+from .metrics import data_age_seconds
+
+TO_REDACT = {CONF_USERNAME, CONF_PASSWORD, CONF_WEBHOOK_ID, "unique_id", "title"}
+
+
+async def async_get_config_entry_diagnostics(hass, entry):
+    """Return diagnostics for a config entry."""
+    coordinator = hass.data[DOMAIN][entry.entry_id]
+    data = dict(coordinator.data or {})
+    if data.get("schedule") is not None:
+        data["schedule"] = repr(data["schedule"])
+
+    return {
+        "entry": async_redact_data(entry.as_dict(), TO_REDACT),
+        "data": data,
+        "data_age_seconds": data_age_seconds(data),
+        "last_update_success": coordinator.last_update_success,
+        "circuit_breaker": coordinator.breaker.as_dict(),
+        "endpoints": coordinator.endpoints.as_dict(),
+        "planner": coordinator.planner.as_dict(),
+        "metrics": coordinator.metrics.as_dict(),
+    }
@@ -0,0 +1,181 @@
+"""
+Hedged fetches across several OreFree scraper add-on endpoints.
+"""
+
+import asyncio
+import logging
+import time
+from collections import deque
+
+from homeassistant.const import CONF_HOST
+
+from .auth import OrefreeAuth
+from .const import CONF_PORT
+
+_LOGGER = logging.getLogger(__name__)
+
+# Hedge delay in seconds while there are too few latency samples
+DEFAULT_HEDGE_DELAY = 10.0
+# Bounds of the hedge delay derived from recent latencies
+MIN_HEDGE_DELAY = 1.0
+MAX_HEDGE_DELAY = 60.0
+# Recent successful fetch latencies kept, and how many are needed to use them
+LATENCY_SAMPLES = 20
+MIN_LATENCY_SAMPLES = 5
+# Percentile of the recent latencies after which the next endpoint is tried
+HEDGE_PERCENTILE = 90
+# Consecutive failures after which an endpoint is moved behind the healthy ones
+DEMOTE_AFTER_FAILURES = 2
+
+
+def parse_endpoints(value, default_port):
+    """Return the (host, port) pairs from "host:port, host2" or a list of such strings."""
+    if isinstance(value, str):
+        value = value.replace(";", ",").split(",")
+    endpoints = []
+    for item in value or ():
+        item = str(item).strip()
+        if not item:
+            continue
+        host, sep, port = item.rpartition(":")
+        if not sep:
+            host, port = item, default_port
+        if not host:
+            raise ValueError(f"Invalid add-on endpoint '{item}', expected host:port")
+        endpoints.append((host, int(port)))
+    return endpoints
+
+
+class AddonEndpoint:
+    """One add-on instance with its own session and failure streak."""
+
+    def __init__(self, index, host, port, auth):
+        """Initialize the endpoint, ``index`` being its configured position."""
+        self.index = index
+        self.host = host
+        self.port = port
+        self.auth = auth
+        self.failures = 0
+        self.wins = 0
+
+    @property
+    def demoted(self):
+        """Return True while the endpoint keeps failing."""
+        return self.failures >= DEMOTE_AFTER_FAILURES
+
+    def as_dict(self):
+        """Return the endpoint state for diagnostics."""
+        return {
+            "endpoint": f"{self.host}:{self.port}",
+            "consecutive_failures": self.failures,
+            "demoted": self.demoted,
+            "wins": self.wins,
+            **self.auth.as_dict(),
+        }
+
+
+class AddonEndpoints:
+    """Ordered add-on endpoints of one account, fetched with hedged requests.
+
+    The first endpoint in order gets the request. If it has not answered
+    after the hedge delay (a high percentile of recent fetch latencies), or
+    fails before that, the next one is asked too; the first valid answer
+    wins and the requests still running are cancelled. Endpoints failing
+    ``DEMOTE_AFTER_FAILURES`` times in a row move behind the healthy ones
+    until they answer again. With a single endpoint this is a plain fetch.
+    """
+
+    def __init__(self, endpoints, username, password, clock=time.monotonic):
+        """Initialize from the (host, port) pairs, in configured order.
+
+        ``clock`` returns monotonic seconds, for the session token expiry and
+        the fetch latencies the hedge delay is derived from.
+        """
+        self._clock = clock
+        self._endpoints = [
+            AddonEndpoint(index, host, port, OrefreeAuth(username, password, clock))
+            for index, (host, port) in enumerate(endpoints)
+        ]
+        self._latencies = deque(maxlen=LATENCY_SAMPLES)
+        self.hedges = 0
+
+    @property
+    def addresses(self):
+        """Return the configured (host, port) pairs."""
+        return [(endpoint.host, endpoint.port) for endpoint in self._endpoints]
+
+    def ordered(self):
+        """Return the endpoints in the order they are tried."""
+        return sorted(self._endpoints, key=lambda endpoint: (endpoint.demoted, endpoint.index))
+
+    def hedge_delay(self):
+        """Return the seconds to wait for an endpoint before asking the next one."""
+        if len(self._latencies) < MIN_LATENCY_SAMPLES:
+            return DEFAULT_HEDGE_DELAY
+        ordered = sorted(self._latencies)
+        latency = ordered[min(len(ordered) - 1, len(ordered) * HEDGE_PERCENTILE // 100)]
+        return min(MAX_HEDGE_DELAY, max(MIN_HEDGE_DELAY, latency))
+
+    async def fetch(self, fetcher, hass, config, metrics=None, clock=None):
+        """Fetch with ``fetcher`` (fetch_orefree_data) from the endpoints, hedged."""
+        order = self.ordered()
+        started = {}
+        pending = set()
+        try:
+            for position, endpoint in enumerate(order):
+                if position:
+                    self.hedges += 1
+                    _LOGGER.debug(f"Hedging the OreFree fetch to {endpoint.host}:{endpoint.port}")
+                endpoint_config = {**config, CONF_HOST: endpoint.host, CONF_PORT: endpoint.port}
+                task = hass.async_create_background_task(
+                    fetcher(hass, endpoint_config, metrics, endpoint.auth, clock),
+                    f"orefree fetch {endpoint.host}:{endpoint.port}",
+                )
+                started[task] = (endpoint, self._clock())
+                pending.add(task)
+
+                # Only the last endpoint is waited for until the end
+                hedge = position < len(order) - 1
+                while pending:
+                    done, pending = await asyncio.wait(
+                        pending,
+                        timeout=self.hedge_delay() if hedge else None,
+                        return_when=asyncio.FIRST_COMPLETED,
+                    )
+                    for task in done:
+                        data = self._finish(task, *started[task])
+                        if data:
+                            return data
+                    if hedge:
+                        break
+            return {}
+        finally:
+            for task in pending:
+                task.cancel()
+
+    def _finish(self, task, endpoint, start):
+        """Record the outcome of a finished request, return its data if valid."""
+        try:
+            data = task.result()
+        except Exception as e:
+            _LOGGER.error(f"Unexpected error fetching from {endpoint.host}:{endpoint.port}: {e}")
+            data = None
+
+        if not data or data.get("text") is None:
+            endpoint.failures += 1
+            if endpoint.failures == DEMOTE_AFTER_FAILURES and len(self._endpoints) > 1:
+                _LOGGER.warning(f"OreFree add-on {endpoint.host}:{endpoint.port} keeps failing, trying it last")
+            return None
+
+        endpoint.failures = 0
+        endpoint.wins += 1
+        self._latencies.append(self._clock() - start)
+        return data
+
+    def as_dict(self):
+        """Return the endpoints and hedging state for diagnostics."""
+        return {
+            "hedge_delay": self.hedge_delay(),
+            "hedges": self.hedges,
+            "endpoints": [endpoint.as_dict() for endpoint in self.ordered()],
+        }
@@ -0,0 +1,44 @@
+"""
+Base entity for orefree entities.
+"""
+
+from homeassistant.const import CONF_USERNAME
+from homeassistant.core import callback
+from homeassistant.helpers.device_registry import DeviceEntryType
+from homeassistant.helpers.entity import DeviceInfo
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
+
+from .const import DOMAIN
+
+
+class OrefreeEntity(CoordinatorEntity):
+    """OreFree entity scoped to the config entry of its coordinator."""
+
+    _key = None
+    # Coordinator data keys the state depends on, None means any change
+    _watched_keys = None
+
+    def __init__(self, coordinator):
+        """Initialize the entity."""
+        super().__init__(coordinator)
+        entry = coordinator.config_entry
+        self._attr_unique_id = f"{entry.entry_id}_{self._key}"
+        self._attr_device_info = DeviceInfo(
+            identifiers={(DOMAIN, entry.entry_id)},
+            name=f"OreFree {entry.data.get(CONF_USERNAME)}",
+            manufacturer="OreFree",
+            entry_type=DeviceEntryType.SERVICE,
+        )
+
+    def _data_changed(self):
+        """Return True if the last coordinator update touched a watched key."""
+        changed = getattr(self.coordinator, "changed_keys", None)
+        if changed is None or self._watched_keys is None:
+            return True
+        return not changed.isdisjoint(self._watched_keys)
+
+    @callback
+    def _handle_coordinator_update(self):
+        """Write the state only if one of the watched keys changed."""
+        if self._data_changed():
+            super()._handle_coordinator_update()
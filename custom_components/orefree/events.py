@@ -0,0 +1,145 @@
+"""
+Bus events fired before, at the start and at the end of OreFree windows.
+"""
+
+import logging
+from bisect import insort
+from datetime import timedelta
+
+from homeassistant.core import callback
+from homeassistant.util import dt as dt_util
+
+from .const import CONF_LEAD_TIMES, DEFAULT_LEAD_TIMES
+from .timer import RefreshTimer
+
+_LOGGER = logging.getLogger(__name__)
+
+EVENT_WINDOW_APPROACHING = "orefree_window_approaching"
+EVENT_WINDOW_STARTED = "orefree_window_started"
+EVENT_WINDOW_ENDED = "orefree_window_ended"
+
+# Windows further ahead than this are planned on a later coordinator update
+PLANNING_HORIZON = timedelta(days=4)
+
+
+def parse_lead_times(value):
+    """Return the sorted, distinct lead times in minutes from "15, 60" or a list."""
+    if isinstance(value, str):
+        value = [part for part in value.replace(";", ",").split(",") if part.strip()]
+    lead_times = sorted({int(minutes) for minutes in value})
+    if any(minutes <= 0 for minutes in lead_times):
+        raise ValueError("Lead times must be positive minutes")
+    return tuple(lead_times)
+
+
+class WindowEventScheduler:
+    """Fire window events of one config entry at their exact times.
+
+    The events of all windows known to the coordinator's history, from now
+    to ``PLANNING_HORIZON`` ahead, are kept in a sorted list and a single
+    timer is armed for the first one. The plan is rebuilt only when the
+    coordinator publishes a new schedule; events already past are dropped,
+    except the start of a window in progress that was never announced, and
+    events at or before the last fired one are never planned again, so each
+    event fires once per window.
+    """
+
+    def __init__(self, hass, entry, coordinator):
+        """Initialize the scheduler, call ``async_start`` to begin."""
+        self._hass = hass
+        self._entry = entry
+        self._coordinator = coordinator
+        self._lead_times = parse_lead_times(
+            entry.options.get(CONF_LEAD_TIMES, entry.data.get(CONF_LEAD_TIMES, DEFAULT_LEAD_TIMES))
+        )
+        self._pending = []
+        self._watermark = None
+        self._unsub = None
+        self._timer = RefreshTimer(hass, entry, "window events", self._async_fire_due, clock=coordinator.clock)
+
+    @property
+    def pending(self):
+        """Return the planned (time, event type, event data) tuples."""
+        return list(self._pending)
+
+    @callback
+    def async_start(self):
+        """Plan the events of the current schedule and follow its updates."""
+        self._watermark = self._coordinator.clock.now()
+        self._unsub = self._coordinator.async_add_listener(self._handle_coordinator_update)
+        self._plan()
+
+    @callback
+    def async_stop(self):
+        """Stop following the coordinator and cancel the pending timer."""
+        if self._unsub:
+            self._unsub()
+            self._unsub = None
+        self._timer.cancel()
+        self._pending = []
+
+    @callback
+    def set_lead_times(self, lead_times):
+        """Use new lead times for the windows not yet started."""
+        self._lead_times = parse_lead_times(lead_times)
+        self._plan()
+
+    @callback
+    def _handle_coordinator_update(self):
+        """Replan when the windows changed."""
+        changed = self._coordinator.changed_keys
+        if changed is None or not changed.isdisjoint(("days", "schedule")):
+            self._plan()
+
+    @callback
+    def _plan(self):
+        """Rebuild the sorted event list and arm the timer for the first event."""
+        now = self._coordinator.clock.now()
+        tz = dt_util.get_default_time_zone()
+        windows = self._coordinator.history.events_between(
+            now.replace(tzinfo=None), (now + PLANNING_HORIZON).replace(tzinfo=None)
+        )
+
+        pending = []
+        for start, end in windows:
+            start = start.replace(tzinfo=tz)
+            end = end.replace(tzinfo=tz)
+            data = {"entry_id": self._entry.entry_id, "start": start.isoformat(), "end": end.isoformat()}
+            if start <= now:
+                # Already in progress: only its start is announced, right away, if it never was
+                if start > self._watermark:
+                    self._add(pending, now, EVENT_WINDOW_STARTED, data)
+            else:
+                for minutes in self._lead_times:
+                    lead_data = {**data, "lead_minutes": minutes}
+                    when = start - timedelta(minutes=minutes)
+                    if when > now:
+                        self._add(pending, when, EVENT_WINDOW_APPROACHING, lead_data)
+                self._add(pending, start, EVENT_WINDOW_STARTED, data)
+            self._add(pending, end, EVENT_WINDOW_ENDED, data)
+        self._pending = pending
+        self._arm()
+
+    def _add(self, pending, when, event_type, data):
+        """Insert an event unless it is not after the last fired one."""
+        if when > self._watermark:
+            insort(pending, (when, event_type, data), key=lambda event: event[0])
+
+    @callback
+    def _arm(self):
+        """Arm the timer for the first pending event."""
+        if self._pending:
+            self._timer.schedule(self._pending[0][0])
+        else:
+            self._timer.cancel()
+
+    async def _async_fire_due(self):
+        """Fire every event that is due and arm the timer for the next one."""
+        now = self._coordinator.clock.now()
+        self._coordinator.metrics.record_wakeup("window_events")
+        while self._pending and self._pending[0][0] <= now:
+            when, event_type, data = self._pending.pop(0)
+            self._watermark = max(self._watermark, when)
+            _LOGGER.debug(f"Firing {event_type} for the window {data['start']}-{data['end']}")
+            self._hass.bus.async_fire(event_type, data)
+        self._arm()
@@ -0,0 +1,87 @@
+"""
+Date-indexed in-memory history of OreFree windows.
+"""
+
+from bisect import bisect_left, bisect_right, insort
+from datetime import date, datetime, timedelta
+
+from .schedule import MINUTES_PER_DAY
+
+# Days of windows kept, older days are dropped as new ones come in
+DEFAULT_RETENTION_DAYS = 400
+
+
+class WindowHistory:
+    """Windows of past and prefetched days, indexed by date.
+
+    Each day is stored as a tuple of (start, end) minute pairs, keyed by its
+    date ordinal, next to a sorted list of ordinals. Range queries bisect
+    into that list, so they only touch the days they return; the number of
+    days is capped by ``retention_days`` counted back from the newest day.
+    """
+
+    def __init__(self, retention_days=DEFAULT_RETENTION_DAYS):
+        """Initialize an empty history."""
+        self._retention_days = retention_days
+        self._ordinals = []
+        self._windows = {}
+
+    def __len__(self):
+        return len(self._ordinals)
+
+    def add(self, day, schedule):
+        """Store the windows of an OrefreeSchedule (or None for no window) for ``day``."""
+        windows = ()
+        if schedule is not None:
+            windows = tuple((w.start_minute, w.end_minute) for w in schedule.windows)
+
+        ordinal = day.toordinal()
+        if ordinal not in self._windows:
+            insort(self._ordinals, ordinal)
+        self._windows[ordinal] = windows
+
+        # Drop the days that fell out of the retention period
+        cutoff = self._ordinals[-1] - self._retention_days
+        expired = bisect_right(self._ordinals, cutoff)
+        if expired:
+            for old in self._ordinals[:expired]:
+                del self._windows[old]
+            del self._ordinals[:expired]
+
+    def spill_over(self, day):
+        """Return the minutes after the midnight ending ``day`` still covered by its windows."""
+        ends = [end for _, end in self._windows.get(day.toordinal(), ())]
+        return max(0, max(ends, default=0) - MINUTES_PER_DAY)
+
+    def events_between(self, start, end):
+        """Return the (start, end) naive datetimes of the windows overlapping [start, end)."""
+        # Windows can cross midnight, so the day before ``start`` may overlap too
+        first = bisect_left(self._ordinals, start.date().toordinal() - 1)
+        last = bisect_right(self._ordinals, end.date().toordinal())
+        events = []
+        for ordinal in self._ordinals[first:last]:
+            midnight = datetime.combine(date.fromordinal(ordinal), datetime.min.time())
+            for start_minute, end_minute in self._windows[ordinal]:
+                event_start = midnight + timedelta(minutes=start_minute)
+                event_end = midnight + timedelta(minutes=end_minute)
+                if event_start < end and event_end > start:
+                    events.append((event_start, event_end))
+        return events
+
+    def as_dict(self):
+        """Return the history for persistence."""
+        return {
+            date.fromordinal(ordinal).isoformat(): [list(w) for w in self._windows[ordinal]]
+            for ordinal in self._ordinals
+        }
+
+    @classmethod
+    def from_dict(cls, data, retention_days=DEFAULT_RETENTION_DAYS):
+        """Restore a history saved with ``as_dict``."""
+        history = cls(retention_days)
+        for day, windows in (data or {}).items():
+            ordinal = date.fromisoformat(day).toordinal()
+            history._ordinals.append(ordinal)
+            history._windows[ordinal] = tuple((int(s), int(e)) for s, e in windows)
+        history._ordinals.sort()
+        return history
@@ -0,0 +1,86 @@
+"""
+Lightweight in-memory metrics for the OreFree coordinator.
+"""
+
+import bisect
+from collections import Counter
+from datetime import datetime
+
+from homeassistant.util import dt as dt_util
+
+# Upper bounds in seconds of the fetch latency histogram buckets
+LATENCY_BUCKETS = (0.5, 1, 2, 5, 10, 30, 60, 120)
+
+
+def data_age_seconds(data):
+    """Return the seconds since the data was last read from the add-on."""
+    last_read = data.get("last_read")
+    if not last_read:
+        return None
+    now = dt_util.now().replace(tzinfo=None)
+    return round((now - datetime.fromisoformat(last_read)).total_seconds())
+
+
+class OrefreeMetrics:
+    """Counters about fetches and timers, kept per coordinator.
+
+    Everything is O(1) to record and stays in memory only; the numbers are
+    read by the diagnostics platform and the diagnostic sensors.
+    """
+
+    def __init__(self):
+        """Initialize empty counters."""
+        self.latency_buckets = [0] * (len(LATENCY_BUCKETS) + 1)
+        self.latency_total = 0.0
+        self.last_latency = None
+        self.successes = 0
+        self.failures = Counter()
+        self.timeouts = 0
+        self.bytes_received = 0
+        self.refreshes_scheduled = 0
+        self.refreshes_executed = 0
+        self.wakeups = Counter()
+
+    @property
+    def fetches(self):
+        """Return the number of fetches that got an answer or failed."""
+        return self.successes + sum(self.failures.values())
+
+    def record_fetch(self, latency, size=0, error=None):
+        """Record one fetch attempt, ``error`` being the exception if it failed."""
+        self.last_latency = latency
+        self.latency_total += latency
+        self.latency_buckets[bisect.bisect_left(LATENCY_BUCKETS, latency)] += 1
+        self.bytes_received += size
+        if error is None:
+            self.successes += 1
+            return
+        self.failures[type(error).__name__] += 1
+        if isinstance(error, TimeoutError):
+            self.timeouts += 1
+
+    def record_wakeup(self, source):
+        """Record a timer callback firing for ``source`` (an entity id or coordinator timer)."""
+        self.wakeups[source] += 1
+
+    def latency_histogram(self):
+        """Return the latency histogram as {"<=bound": count}."""
+        labels = [f"<={bound}s" for bound in LATENCY_BUCKETS] + [f">{LATENCY_BUCKETS[-1]}s"]
+        return dict(zip(labels, self.latency_buckets))
+
+    def as_dict(self):
+        """Return all metrics as plain data."""
+        fetches = self.fetches
+        return {
+            "fetches": fetches,
+            "successes": self.successes,
+            "failures": dict(self.failures),
+            "timeouts": self.timeouts,
+            "bytes_received": self.bytes_received,
+            "last_latency": self.last_latency,
+            "mean_latency": self.latency_total / fetches if fetches else None,
+            "latency_histogram": self.latency_histogram(),
+            "refreshes_scheduled": self.refreshes_scheduled,
+            "refreshes_executed": self.refreshes_executed,
+            "timer_wakeups": dict(self.wakeups),
+        }
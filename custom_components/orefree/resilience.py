@@ -0,0 +1,99 @@
+"""
+Retry backoff and circuit breaker for calls to the OreFree scraper add-on.
+"""
+
+import logging
+import random
+import time
+
+_LOGGER = logging.getLogger(__name__)
+
+STATE_CLOSED = "closed"
+STATE_OPEN = "open"
+STATE_HALF_OPEN = "half_open"
+
+DEFAULT_FAILURE_THRESHOLD = 3
+DEFAULT_RESET_TIMEOUT = 300
+DEFAULT_BACKOFF_BASE = 2.0
+DEFAULT_BACKOFF_CAP = 60.0
+
+
+def backoff_delay(attempt, base=DEFAULT_BACKOFF_BASE, cap=DEFAULT_BACKOFF_CAP):
+    """Return the delay before retry ``attempt`` (0-based), exponential with full jitter."""
+    return random.uniform(0, min(cap, base * 2 ** attempt))
+
+
+class CircuitBreaker:
+    """Fail fast while the add-on keeps failing.
+
+    After ``failure_threshold`` consecutive failures the breaker opens and
+    rejects calls without any network I/O. Once ``reset_timeout`` seconds
+    have passed a single probe call is let through (half open): its success
+    closes the breaker, its failure opens it again for another period.
+    """
+
+    def __init__(self, failure_threshold=DEFAULT_FAILURE_THRESHOLD, reset_timeout=DEFAULT_RESET_TIMEOUT, clock=time.monotonic):
+        """Initialize the breaker in the closed state."""
+        self._failure_threshold = failure_threshold
+        self._reset_timeout = reset_timeout
+        self._clock = clock
+        self._state = STATE_CLOSED
+        self._failures = 0
+        self._opened_at = None
+        self._probe_in_flight = False
+
+    @property
+    def state(self):
+        """Return the breaker state, moving from open to half open once the timeout passed."""
+        if self._state == STATE_OPEN and self.retry_in() == 0:
+            self._state = STATE_HALF_OPEN
+        return self._state
+
+    @property
+    def failures(self):
+        """Return the number of consecutive failures."""
+        return self._failures
+
+    def retry_in(self):
+        """Return the seconds until a probe is allowed, 0 if calls are allowed now."""
+        if self._state != STATE_OPEN:
+            return 0
+        return max(0.0, self._opened_at + self._reset_timeout - self._clock())
+
+    def allow_request(self):
+        """Return True if a call may go out now."""
+        state = self.state
+        if state == STATE_CLOSED:
+            return True
+        if state == STATE_HALF_OPEN and not self._probe_in_flight:
+            _LOGGER.info("OreFree circuit breaker half open, sending a probe request")
+            self._probe_in_flight = True
+            return True
+        return False
+
+    def record_success(self):
+        """Record a successful call and close the breaker."""
+        if self._state != STATE_CLOSED:
+            _LOGGER.info("OreFree circuit breaker closed, add-on is answering again")
+        self._state = STATE_CLOSED
+        self._failures = 0
+        self._opened_at = None
+        self._probe_in_flight = False
+
+    def record_failure(self):
+        """Record a failed call, opening the breaker past the threshold or after a failed probe."""
+        self._failures += 1
+        if self._state == STATE_HALF_OPEN or self._failures >= self._failure_threshold:
+            if self._state != STATE_OPEN:
+                _LOGGER.warning(f"OreFree circuit breaker open after {self._failures} failures, retrying in {self._reset_timeout} seconds")
+            self._state = STATE_OPEN
+            self._opened_at = self._clock()
+        self._probe_in_flight = False
+
+    def as_dict(self):
+        """Return the breaker state for entity attributes."""
+        return {
+            "circuit_state": self.state,
+            "consecutive_failures": self._failures,
+            "circuit_retry_in": round(self.retry_in()),
+        }
@@ -0,0 +1,275 @@
+"""
+Pre-parsed OreFree schedule windows and their interval index.
+"""
+
+from bisect import bisect_right
+from datetime import date, time, timedelta
+
+MINUTES_PER_DAY = 24 * 60
+SECONDS_PER_MINUTE = 60
+DEFAULT_LOCK_OFFSET = 15
+
+# Characters accepted between two "HH:MM-HH:MM" ranges
+RANGE_SEPARATORS = frozenset(" \t\r\n,;/|")
+# Characters accepted between the start and the end of a range
+DASHES = frozenset("-\u2013\u2014")
+
+
+def parse_hhmm(value):
+    """Parse a "HH:MM" string into minutes since midnight."""
+    hours, sep, minutes = value.strip().partition(":")
+    if not sep or not hours.isdigit() or not minutes.isdigit() or len(minutes) != 2:
+        raise ValueError(f"Invalid time '{value}', expected HH:MM")
+    hours = int(hours)
+    minutes = int(minutes)
+    if hours > 23 or minutes > 59:
+        raise ValueError(f"Invalid time '{value}', expected HH:MM")
+    return hours * 60 + minutes
+
+
+def format_hhmm(minute_of_day):
+    """Format minutes since midnight as a "HH:MM" string."""
+    return "%02d:%02d" % divmod(minute_of_day % MINUTES_PER_DAY, 60)
+
+
+def _read_hhmm(text, pos, allow_end_of_day=False):
+    """Read "H:MM" or "HH:MM" at ``pos``, returns (minute of day, next position).
+
+    With ``allow_end_of_day`` "24:00" is accepted as the end of the day.
+    """
+    end = pos
+    while end < len(text) and text[end].isdigit():
+        end += 1
+    if not 1 <= end - pos <= 2 or end + 3 > len(text) or text[end] != ":":
+        raise ValueError(f"Expected HH:MM at position {pos} of '{text}'")
+    hours = int(text[pos:end])
+    minutes_str = text[end + 1:end + 3]
+    if not minutes_str.isdigit():
+        raise ValueError(f"Expected HH:MM at position {pos} of '{text}'")
+    minutes = int(minutes_str)
+    if allow_end_of_day and hours == 24 and minutes == 0:
+        return MINUTES_PER_DAY, end + 3
+    if hours > 23 or minutes > 59:
+        raise ValueError(f"Invalid time at position {pos} of '{text}'")
+    return hours * 60 + minutes, end + 3
+
+
+def parse_windows(text):
+    """Parse one or more "HH:MM-HH:MM" ranges in a single pass.
+
+    Ranges may be separated by whitespace, commas, semicolons, slashes or
+    pipes. A range whose end is not after its start crosses midnight and is
+    returned with an end beyond MINUTES_PER_DAY. Anything else is rejected
+    with ValueError.
+    """
+    windows = []
+    pos = 0
+    length = len(text)
+    while True:
+        while pos < length and text[pos] in RANGE_SEPARATORS:
+            pos += 1
+        if pos == length:
+            break
+
+        start, pos = _read_hhmm(text, pos)
+        while pos < length and text[pos] in " \t":
+            pos += 1
+        if pos == length or text[pos] not in DASHES:
+            raise ValueError(f"Expected '-' at position {pos} of '{text}'")
+        pos += 1
+        while pos < length and text[pos] in " \t":
+            pos += 1
+        end, pos = _read_hhmm(text, pos, allow_end_of_day=True)
+
+        if pos < length and text[pos] not in RANGE_SEPARATORS:
+            raise ValueError(f"Unexpected '{text[pos]}' at position {pos} of '{text}'")
+        if end <= start:
+            end += MINUTES_PER_DAY
+        windows.append(OrefreeWindow(start, end))
+
+    if not windows:
+        raise ValueError(f"No time range in '{text}'")
+    return windows
+
+
+def split_days(body, today):
+    """Split a multi-day add-on response into a {iso date: text} dict.
+
+    Lines starting with an ISO date ("2024-05-02 10:00-13:00") belong to that
+    day; a body without dates is today's schedule, as returned by add-on
+    versions that only know about the current day.
+    """
+    days = {}
+    for line in body.splitlines():
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            day = date.fromisoformat(line[:10])
+        except ValueError:
+            # Single-day response, keep the body as-is for the text sensor
+            return {today.isoformat(): body}
+        days[day.isoformat()] = line[10:].lstrip(" :\t")
+    return days or {today.isoformat(): body}
+
+
+def _merge(intervals):
+    """Return the (start, end) intervals sorted, with overlapping ones merged."""
+    merged = []
+    for start, end in sorted(intervals):
+        if merged and start <= merged[-1][1]:
+            merged[-1][1] = max(merged[-1][1], end)
+        else:
+            merged.append([start, end])
+    return merged
+
+
+class OrefreeWindow:
+    """Immutable OreFree window stored as minute-of-day integers.
+
+    A window crossing midnight has an end beyond MINUTES_PER_DAY.
+    """
+
+    __slots__ = ("start_minute", "end_minute")
+
+    def __init__(self, start_minute, end_minute):
+        """Initialize the window, start must be before end."""
+        if not (0 <= start_minute < MINUTES_PER_DAY and
+                start_minute < end_minute <= start_minute + MINUTES_PER_DAY):
+            raise ValueError(f"Invalid window {start_minute}-{end_minute}")
+        object.__setattr__(self, "start_minute", start_minute)
+        object.__setattr__(self, "end_minute", end_minute)
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __delattr__(self, name):
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __eq__(self, other):
+        if not isinstance(other, OrefreeWindow):
+            return NotImplemented
+        return (self.start_minute, self.end_minute) == (other.start_minute, other.end_minute)
+
+    def __hash__(self):
+        return hash((self.start_minute, self.end_minute))
+
+    def __repr__(self):
+        return f"OrefreeWindow({self.start}-{self.end})"
+
+    @property
+    def start(self):
+        """Return the start as a "HH:MM" string."""
+        return format_hhmm(self.start_minute)
+
+    @property
+    def end(self):
+        """Return the end as a "HH:MM" string."""
+        return format_hhmm(self.end_minute)
+
+    @property
+    def crosses_midnight(self):
+        """Return True if the window ends on the next day."""
+        return self.end_minute > MINUTES_PER_DAY
+
+
+class OrefreeSchedule:
+    """Immutable interval index over the OreFree windows of a day.
+
+    The index spans the day and the next one: ``carry_over`` minutes after
+    midnight still covered by the previous day's last window, the day's
+    windows with their tails past midnight, and the next day assumed to
+    repeat the day's windows until its own schedule is fetched. The intervals
+    are merged and flattened into a sorted tuple of boundaries, so
+    ``is_active`` and ``next_transition`` are a bisect away.
+    """
+
+    __slots__ = ("windows", "carry_over", "_boundaries", "_transitions")
+
+    def __init__(self, windows, carry_over=0):
+        """Build the index from a list of OrefreeWindow and the previous day's spill-over."""
+        windows = tuple(sorted(windows, key=lambda w: (w.start_minute, w.end_minute)))
+        if not windows:
+            raise ValueError("A schedule needs at least one window")
+        carry_over = max(0, min(int(carry_over), MINUTES_PER_DAY))
+
+        intervals = [(0, carry_over)] if carry_over else []
+        for window in windows:
+            intervals.append((window.start_minute, window.end_minute))
+            intervals.append(
+                (window.start_minute + MINUTES_PER_DAY, min(window.end_minute + MINUTES_PER_DAY, 2 * MINUTES_PER_DAY))
+            )
+        boundaries = tuple(minute for interval in _merge(intervals) for minute in interval)
+
+        # Midnight at either end of the index is not an on/off change
+        transitions = [minute for minute in boundaries if 0 < minute < 2 * MINUTES_PER_DAY]
+
+        object.__setattr__(self, "windows", windows)
+        object.__setattr__(self, "carry_over", carry_over)
+        object.__setattr__(self, "_boundaries", boundaries)
+        object.__setattr__(self, "_transitions", tuple(minute * SECONDS_PER_MINUTE for minute in transitions))
+
+    @classmethod
+    def from_text(cls, text, carry_over=0):
+        """Build a schedule from an add-on response body."""
+        return cls(parse_windows(text), carry_over)
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __delattr__(self, name):
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __eq__(self, other):
+        if not isinstance(other, OrefreeSchedule):
+            return NotImplemented
+        return (self.windows, self.carry_over) == (other.windows, other.carry_over)
+
+    def __hash__(self):
+        return hash((self.windows, self.carry_over))
+
+    def __repr__(self):
+        windows = ", ".join(f"{w.start}-{w.end}" for w in self.windows)
+        if self.carry_over:
+            return f"OrefreeSchedule({windows}, carry_over={self.carry_over})"
+        return f"OrefreeSchedule({windows})"
+
+    @property
+    def start(self):
+        """Return the start of the first window as a "HH:MM" string."""
+        return self.windows[0].start
+
+    @property
+    def end(self):
+        """Return the end of the last window as a "HH:MM" string."""
+        return max(self.windows, key=lambda w: w.end_minute).end
+
+    @property
+    def total_minutes(self):
+        """Return the minutes covered by the day's windows, overlaps counted once."""
+        return sum(end - start for start, end in _merge((w.start_minute, w.end_minute) for w in self.windows))
+
+    @property
+    def spill_over(self):
+        """Return the minutes after midnight still covered by the day's last window."""
+        return max(0, max(w.end_minute for w in self.windows) - MINUTES_PER_DAY)
+
+    def is_active(self, now):
+        """Return True if ``now`` falls inside a window (end excluded)."""
+        minute = now.hour * 60 + now.minute
+        return bisect_right(self._boundaries, minute) % 2 == 1
+
+    def next_transition(self, now):
+        """Return the datetime of the next on/off change after ``now``, None if there is none."""
+        if not self._transitions:
+            return None
+        midnight = now.replace(hour=0, minute=0, second=0, microsecond=0)
+        second = (now - midnight).total_seconds()
+        index = bisect_right(self._transitions, second)
+        if index < len(self._transitions):
+            return midnight + timedelta(seconds=self._transitions[index])
+        return None
+
+    def lock_time(self, offset_minutes=DEFAULT_LOCK_OFFSET):
+        """Return the time of day after which the schedule can no longer change."""
+        return time(*divmod(max(self.windows[0].start_minute - offset_minutes, 0), 60))
@@ -0,0 +1,127 @@
+"""
+Adaptive refresh planner for OreFree polling.
+"""
+
+import logging
+from collections import deque
+from datetime import timedelta
+
+from .schedule import DEFAULT_LOCK_OFFSET
+
+_LOGGER = logging.getLogger(__name__)
+
+# Every poll happens at second 30 of its minute
+POLL_SECOND = 30
+# Fixed polling grid: 00:00:30, then every :45:30 until the 20:45:30 cutoff
+GRID_MINUTE = 45
+CUTOFF_HOUR = 20
+CUTOFF_MINUTE = 45
+# Minutes polled inside hours that produced changes before
+HOT_HOUR_MINUTES = (15, 45)
+# Days to observe on the full grid before trusting the history
+MIN_DAYS_OBSERVED = 7
+# Number of recorded changes kept, older ones fade out
+MAX_CHANGES = 60
+# Poll the full grid one day out of this many to keep learning
+EXPLORE_EVERY_DAYS = 7
+
+
+class AdaptiveRefreshPlanner:
+    """Pick the next poll time from the history of schedule changes.
+
+    Every fetch is recorded; when the fetched text first differs from the
+    previous fetch of the same day, the minute of day is remembered. Once
+    enough days have been observed, only the hours that produced a change are
+    polled (twice, at :15:30 and :45:30), plus the 00:00:30 day start and the
+    cutoff (20:45:30 by default). One day a week the full hourly grid is used
+    again so the history keeps up with the site.
+    """
+
+    def __init__(self, changes=(), days_observed=0, cutoff=(CUTOFF_HOUR, CUTOFF_MINUTE), lock_offset=DEFAULT_LOCK_OFFSET):
+        """Initialize the planner from persisted state.
+
+        ``cutoff`` (hour, minute) is the last poll of the day and
+        ``lock_offset`` the default for ``next_refresh_time``; both are
+        settings, not persisted, and can be changed on a live planner.
+        """
+        self._changes = deque((int(m) for m in changes), maxlen=MAX_CHANGES)
+        self._days_observed = int(days_observed)
+        self.cutoff = tuple(cutoff)
+        self.lock_offset = lock_offset
+        self._last_text = None
+        self._last_date = None
+
+    def as_dict(self):
+        """Return the planner state for persistence."""
+        return {
+            "changes": list(self._changes),
+            "days_observed": self._days_observed,
+        }
+
+    def record_fetch(self, now, text):
+        """Record a fetched payload, returns True if it changed during the day."""
+        changed = False
+        today = now.date()
+        if self._last_date is not None and self._last_date != today:
+            self._days_observed += 1
+        elif self._last_text is not None and text != self._last_text:
+            self._changes.append(now.hour * 60 + now.minute)
+            changed = True
+            _LOGGER.info(f"OreFree schedule changed at {now.time()}, {len(self._changes)} changes recorded")
+        self._last_text = text
+        self._last_date = today
+        return changed
+
+    def seed(self, now, text):
+        """Set the last known payload without recording a change (e.g. from cache)."""
+        today = now.date()
+        if self._last_date is not None and self._last_date != today:
+            self._days_observed += 1
+        self._last_text = text
+        self._last_date = today
+
+    def poll_slots(self, day):
+        """Return the sorted (hour, minute) poll slots after 00:00:30 for ``day``."""
+        cutoff_hour = self.cutoff[0]
+        if self._days_observed < MIN_DAYS_OBSERVED or day.toordinal() % EXPLORE_EVERY_DAYS == 0:
+            grid = {(hour, GRID_MINUTE) for hour in range(cutoff_hour + 1) if (hour, GRID_MINUTE) <= self.cutoff}
+            return sorted(grid | {self.cutoff})
+
+        slots = {self.cutoff}
+        for hour in {minute // 60 for minute in self._changes}:
+            if hour > cutoff_hour:
+                continue
+            for minute in HOT_HOUR_MINUTES:
+                if (hour, minute) <= self.cutoff:
+                    slots.add((hour, minute))
+        return sorted(slots)
+
+    def next_refresh_time(self, now, schedule=None, lock_offset=None, tomorrow_known=True):
+        """Return the next poll time after ``now``.
+
+        Nothing is polled after the lock time of the OrefreeSchedule
+        (``lock_offset`` minutes before its first window, the planner's
+        ``lock_offset`` by default) until the next day. The lock only covers
+        today's schedule: while ``tomorrow_known`` is False the slots up to
+        the cutoff are still polled for the next day's.
+        """
+        if lock_offset is None:
+            lock_offset = self.lock_offset
+        day_start = now.replace(hour=0, minute=0, second=POLL_SECOND, microsecond=0)
+        if now < day_start:
+            return day_start
+        tomorrow = day_start + timedelta(days=1)
+
+        lock_time = schedule.lock_time(lock_offset) if schedule is not None and tomorrow_known else None
+        if lock_time is not None and now.time() > lock_time:
+            _LOGGER.debug(f"Current time {now.time()} is after OreFree lock time {lock_time}, next poll tomorrow")
+            return tomorrow
+
+        for hour, minute in self.poll_slots(now.date()):
+            slot = now.replace(hour=hour, minute=minute, second=POLL_SECOND, microsecond=0)
+            if lock_time is not None and slot.time() > lock_time:
+                # Schedule is locked before this slot, nothing left to learn today
+                break
+            if slot > now:
+                return slot
+        return tomorrow
@@ -3,10 +3,16 @@ Defines orefree sensors for Home Assistant.
 """
 
 import logging
-from homeassistant.components.sensor import SensorEntity
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
+from datetime import datetime, time
+from homeassistant.components.sensor import SensorDeviceClass, SensorEntity, SensorStateClass
+from homeassistant.const import EntityCategory, UnitOfTime
+from homeassistant.util import dt as dt_util
 
-from .coordinator import create_orefree_coordinator
+from .const import DOMAIN
+from .entity import OrefreeEntity
+from .metrics import data_age_seconds
+from .schedule import format_hhmm
+from .stats import PERIOD_MONTH, PERIOD_WEEK, PERIOD_YEAR, period_start
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -14,21 +20,28 @@ _LOGGER = logging.getLogger(__name__)
 # For config flow support
 async def async_setup_entry(hass, entry, async_add_entities):
     """Set up OreFree sensors."""
-    coordinator = hass.data.get("orefree_coordinator")
+    coordinator = hass.data[DOMAIN][entry.entry_id]
     async_add_entities([
         OrefreeTextSensor(coordinator),
         OrefreeStartSensor(coordinator),
         OrefreeEndSensor(coordinator),
         OrefreeLastReadSensor(coordinator),
-        OrefreeNextRefreshSensor(coordinator)
+        OrefreeNextRefreshSensor(coordinator),
+        OrefreeHoursSensor(coordinator, PERIOD_WEEK),
+        OrefreeHoursSensor(coordinator, PERIOD_MONTH),
+        OrefreeHoursSensor(coordinator, PERIOD_YEAR),
+        OrefreeAverageStartSensor(coordinator),
+        OrefreeFetchLatencySensor(coordinator),
+        OrefreeFetchFailuresSensor(coordinator),
     ])
 
 
-class OrefreeTextSensor(CoordinatorEntity, SensorEntity):
+class OrefreeTextSensor(OrefreeEntity, SensorEntity):
     """OreFree text sensor."""
     
     _attr_name = "Orefree Text"
-    _attr_unique_id = "orefree_text"
+    _key = "text"
+    _watched_keys = ("text",)
     _attr_icon = "mdi:text"
 
     def __init__(self, coordinator):
@@ -44,11 +57,12 @@ class OrefreeTextSensor(CoordinatorEntity, SensorEntity):
         return text.replace(" ", "") if text != "Unknown" else text
 
 
-class OrefreeStartSensor(CoordinatorEntity, SensorEntity):
+class OrefreeStartSensor(OrefreeEntity, SensorEntity):
     """OreFree start time sensor."""
     
     _attr_name = "Orefree Start"
-    _attr_unique_id = "orefree_start"
+    _key = "start"
+    _watched_keys = ("start",)
     _attr_icon = "mdi:clock-start"
 
     def __init__(self, coordinator):
@@ -62,11 +76,12 @@ class OrefreeStartSensor(CoordinatorEntity, SensorEntity):
         return data.get("start", None)
 
 
-class OrefreeEndSensor(CoordinatorEntity, SensorEntity):
+class OrefreeEndSensor(OrefreeEntity, SensorEntity):
     """OreFree end time sensor."""
     
     _attr_name = "Orefree End"
-    _attr_unique_id = "orefree_end"
+    _key = "end"
+    _watched_keys = ("end",)
     _attr_icon = "mdi:clock-end"
 
     def __init__(self, coordinator):
@@ -80,11 +95,12 @@ class OrefreeEndSensor(CoordinatorEntity, SensorEntity):
         return data.get("end", None)
 
 
-class OrefreeLastReadSensor(CoordinatorEntity, SensorEntity):
+class OrefreeLastReadSensor(OrefreeEntity, SensorEntity):
     """OreFree last read sensor."""
     
     _attr_name = "Orefree Last Read"
-    _attr_unique_id = "orefree_last_read"
+    _key = "last_read"
+    _watched_keys = ("last_read", "circuit")
     _attr_icon = "mdi:clock-check"
 
     def __init__(self, coordinator):
@@ -97,12 +113,18 @@ class OrefreeLastReadSensor(CoordinatorEntity, SensorEntity):
         data = self.coordinator.data or {}
         return data.get("last_read", None)
 
+    @property
+    def extra_state_attributes(self):
+        """Return the circuit breaker state of the add-on connection."""
+        return self.coordinator.breaker.as_dict()
+
 
-class OrefreeNextRefreshSensor(CoordinatorEntity, SensorEntity):
+class OrefreeNextRefreshSensor(OrefreeEntity, SensorEntity):
     """OreFree next refresh sensor."""
     
     _attr_name = "Orefree Next Refresh"
-    _attr_unique_id = "orefree_next_refresh"
+    _key = "next_refresh"
+    _watched_keys = ("next_refresh",)
     _attr_icon = "mdi:timer"
 
     def __init__(self, coordinator):
@@ -114,3 +136,118 @@ class OrefreeNextRefreshSensor(CoordinatorEntity, SensorEntity):
         """Return the state of the sensor."""
         data = self.coordinator.data or {}
         return data.get("next_refresh", None)
+
+
+class OrefreeHoursSensor(OrefreeEntity, SensorEntity):
+    """OreFree hours in the current week, month or year."""
+
+    _attr_icon = "mdi:clock-plus-outline"
+    _attr_device_class = SensorDeviceClass.DURATION
+    _attr_native_unit_of_measurement = UnitOfTime.HOURS
+    _attr_state_class = SensorStateClass.TOTAL
+    _watched_keys = ("days", "schedule")
+    _attr_suggested_display_precision = 1
+
+    def __init__(self, coordinator, period):
+        """Initialize the sensor for ``period``."""
+        self._period = period
+        self._key = f"hours_{period}"
+        self._attr_name = f"Orefree Hours {period.capitalize()}"
+        super().__init__(coordinator)
+
+    @property
+    def native_value(self):
+        """Return the OreFree hours of the current period."""
+        return self.coordinator.statistics.hours(self._period, dt_util.now().date())
+
+    @property
+    def last_reset(self):
+        """Return the start of the current period, when the total restarts from 0."""
+        start = period_start(self._period, dt_util.now().date())
+        return datetime.combine(start, time.min, tzinfo=dt_util.get_default_time_zone())
+
+
+class OrefreeAverageStartSensor(OrefreeEntity, SensorEntity):
+    """OreFree average start of the first window of the day."""
+
+    _attr_name = "Orefree Average Start"
+    _key = "average_start"
+    _watched_keys = ("days", "schedule")
+    _attr_icon = "mdi:clock-start"
+    _attr_native_unit_of_measurement = UnitOfTime.HOURS
+    _attr_state_class = SensorStateClass.MEASUREMENT
+    _attr_suggested_display_precision = 2
+
+    def __init__(self, coordinator):
+        """Initialize the sensor."""
+        super().__init__(coordinator)
+
+    @property
+    def native_value(self):
+        """Return the average start as hours since midnight."""
+        minute = self.coordinator.statistics.average_start_minute
+        return None if minute is None else minute / 60
+
+    @property
+    def extra_state_attributes(self):
+        """Return the average start as a "HH:MM" string."""
+        minute = self.coordinator.statistics.average_start_minute
+        return {"average_start": None if minute is None else format_hhmm(round(minute))}
+
+
+class OrefreeFetchLatencySensor(OrefreeEntity, SensorEntity):
+    """OreFree diagnostic sensor with the latency of the last add-on fetch."""
+
+    _attr_name = "Orefree Fetch Latency"
+    _key = "fetch_latency"
+    _attr_icon = "mdi:timer-sand"
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_entity_registry_enabled_default = False
+    _attr_native_unit_of_measurement = UnitOfTime.SECONDS
+    _attr_state_class = SensorStateClass.MEASUREMENT
+    _attr_suggested_display_precision = 2
+
+    @property
+    def native_value(self):
+        """Return the latency of the last fetch."""
+        return self.coordinator.metrics.last_latency
+
+    @property
+    def extra_state_attributes(self):
+        """Return the latency histogram and the age of the current data."""
+        metrics = self.coordinator.metrics
+        return {
+            "mean_latency": metrics.as_dict()["mean_latency"],
+            "latency_histogram": metrics.latency_histogram(),
+            "data_age_seconds": data_age_seconds(self.coordinator.data or {}),
+        }
+
+
+class OrefreeFetchFailuresSensor(OrefreeEntity, SensorEntity):
+    """OreFree diagnostic sensor counting failed add-on fetches."""
+
+    _attr_name = "Orefree Fetch Failures"
+    _key = "fetch_failures"
+    _attr_icon = "mdi:alert-circle-outline"
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_entity_registry_enabled_default = False
+    _attr_state_class = SensorStateClass.TOTAL_INCREASING
+
+    @property
+    def native_value(self):
+        """Return the number of failed fetches since start."""
+        return sum(self.coordinator.metrics.failures.values())
+
+    @property
+    def extra_state_attributes(self):
+        """Return failure counts by exception class and the other counters."""
+        metrics = self.coordinator.metrics.as_dict()
+        return {
+            "failures_by_exception": metrics["failures"],
+            "successes": metrics["successes"],
+            "timeouts": metrics["timeouts"],
+            "bytes_received": metrics["bytes_received"],
+            "refreshes_scheduled": metrics["refreshes_scheduled"],
+            "refreshes_executed": metrics["refreshes_executed"],
+            "timer_wakeups": metrics["timer_wakeups"],
+        }
@@ -0,0 +1,97 @@
+"""
+Services of the OreFree integration.
+"""
+
+import asyncio
+import logging
+from datetime import datetime
+
+import voluptuous as vol
+from homeassistant.core import ServiceCall, SupportsResponse, callback
+from homeassistant.exceptions import ServiceValidationError
+from homeassistant.helpers import config_validation as cv
+from homeassistant.util import dt as dt_util
+
+from .const import DOMAIN
+from .schedule import OrefreeSchedule
+
+_LOGGER = logging.getLogger(__name__)
+
+SERVICE_REFRESH = "refresh"
+SERVICE_GET_SCHEDULE = "get_schedule"
+
+ATTR_ENTRY_ID = "entry_id"
+
+SERVICE_SCHEMA = vol.Schema({vol.Optional(ATTR_ENTRY_ID): cv.string})
+
+
+def _coordinators(hass, call):
+    """Return the coordinators targeted by ``call``: one entry, or all of them."""
+    coordinators = hass.data.get(DOMAIN, {})
+    entry_id = call.data.get(ATTR_ENTRY_ID)
+    if entry_id is None:
+        return dict(coordinators)
+    if entry_id not in coordinators:
+        raise ServiceValidationError(f"No loaded OreFree entry with id {entry_id}")
+    return {entry_id: coordinators[entry_id]}
+
+
+def _windows(schedule):
+    """Return the windows of an OrefreeSchedule as plain data."""
+    if schedule is None:
+        return []
+    return [{"start": w.start, "end": w.end} for w in schedule.windows]
+
+
+def _day_windows(text):
+    """Return the windows of a day's text, empty if it has none."""
+    try:
+        return _windows(OrefreeSchedule.from_text(text))
+    except ValueError:
+        return []
+
+
+def schedule_response(coordinator, now):
+    """Return the schedule held by ``coordinator`` as service response data."""
+    data = coordinator.data or {}
+    schedule = data.get("schedule")
+    next_transition = schedule.next_transition(now) if schedule is not None else None
+    next_refresh = data.get("next_refresh")
+    return {
+        "title": coordinator.config_entry.title,
+        "text": data.get("text"),
+        "windows": _windows(schedule),
+        "active": schedule.is_active(now) if schedule is not None else False,
+        "next_transition": next_transition.isoformat() if next_transition else None,
+        "days": {day: _day_windows(text) for day, text in (data.get("days") or {}).items()},
+        "last_read": data.get("last_read"),
+        "next_refresh": next_refresh.isoformat() if isinstance(next_refresh, datetime) else next_refresh,
+    }
+
+
+@callback
+def async_setup_services(hass):
+    """Register the OreFree services."""
+
+    async def async_handle_refresh(call: ServiceCall):
+        """Request a refresh, bursts of calls collapse into a single scrape."""
+        await asyncio.gather(
+            *(coordinator.async_request_manual_refresh() for coordinator in _coordinators(hass, call).values())
+        )
+
+    async def async_handle_get_schedule(call: ServiceCall):
+        """Return the schedules in memory, without calling the add-on."""
+        now = dt_util.now()
+        return {
+            entry_id: schedule_response(coordinator, now)
+            for entry_id, coordinator in _coordinators(hass, call).items()
+        }
+
+    hass.services.async_register(DOMAIN, SERVICE_REFRESH, async_handle_refresh, schema=SERVICE_SCHEMA)
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_GET_SCHEDULE,
+        async_handle_get_schedule,
+        schema=SERVICE_SCHEMA,
+        supports_response=SupportsResponse.ONLY,
+    )
@@ -0,0 +1,115 @@
+"""
+Running OreFree usage statistics.
+"""
+
+from datetime import timedelta
+
+PERIOD_WEEK = "week"
+PERIOD_MONTH = "month"
+PERIOD_YEAR = "year"
+PERIODS = (PERIOD_WEEK, PERIOD_MONTH, PERIOD_YEAR)
+
+# Days whose contribution is remembered, so a revised schedule replaces it
+REVISABLE_DAYS = 7
+
+
+def period_key(period, day):
+    """Return the key of the week, month or year ``day`` belongs to."""
+    if period == PERIOD_WEEK:
+        year, week, _ = day.isocalendar()
+        return f"{year}-W{week:02d}"
+    if period == PERIOD_MONTH:
+        return f"{day.year}-{day.month:02d}"
+    return str(day.year)
+
+
+def period_start(period, day):
+    """Return the first day of the week, month or year ``day`` belongs to."""
+    if period == PERIOD_WEEK:
+        return day - timedelta(days=day.weekday())
+    if period == PERIOD_MONTH:
+        return day.replace(day=1)
+    return day.replace(month=1, day=1)
+
+
+class UsageStatistics:
+    """OreFree minutes per week, month and year and the average window start.
+
+    Each day's schedule is folded in once, in O(1): its minutes are added to
+    the current bucket of every period and its first start to a running
+    mean. If the schedule of a recent day is revised, the old contribution is
+    subtracted first. Only the buckets of the current and the previous
+    period are kept.
+    """
+
+    def __init__(self):
+        """Initialize empty statistics."""
+        self._buckets = {period: {} for period in PERIODS}
+        self._recent = {}
+        self._start_sum = 0
+        self._start_count = 0
+
+    def update(self, day, schedule):
+        """Fold the OrefreeSchedule (or None) of ``day`` in, returns True if anything changed."""
+        contribution = (schedule.total_minutes, schedule.windows[0].start_minute) if schedule is not None else (0, None)
+        key = day.isoformat()
+        previous = self._recent.get(key)
+        if previous == contribution:
+            return False
+        if previous is not None:
+            self._apply(day, previous, -1)
+        self._apply(day, contribution, 1)
+        self._recent[key] = contribution
+
+        # Forget contributions that can no longer be revised
+        cutoff = (day - timedelta(days=REVISABLE_DAYS)).isoformat()
+        for old in [k for k in self._recent if k < cutoff]:
+            del self._recent[old]
+        return True
+
+    def _apply(self, day, contribution, sign):
+        """Add (sign=1) or remove (sign=-1) a day's (minutes, start) contribution."""
+        minutes, start = contribution
+        for period in PERIODS:
+            buckets = self._buckets[period]
+            key = period_key(period, day)
+            buckets[key] = buckets.get(key, 0) + sign * minutes
+            # Keep the current and the previous period only
+            for old in sorted(buckets)[:-2]:
+                del buckets[old]
+        if start is not None:
+            self._start_sum += sign * start
+            self._start_count += sign
+
+    def hours(self, period, day):
+        """Return the OreFree hours in the ``period`` containing ``day``."""
+        return self._buckets[period].get(period_key(period, day), 0) / 60
+
+    @property
+    def average_start_minute(self):
+        """Return the mean first window start in minutes since midnight, None if unknown."""
+        if not self._start_count:
+            return None
+        return self._start_sum / self._start_count
+
+    def as_dict(self):
+        """Return the statistics for persistence."""
+        return {
+            "buckets": self._buckets,
+            "recent": {day: list(c) for day, c in self._recent.items()},
+            "start_sum": self._start_sum,
+            "start_count": self._start_count,
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        """Restore statistics saved with ``as_dict``."""
+        stats = cls()
+        if not data:
+            return stats
+        for period in PERIODS:
+            stats._buckets[period] = dict(data.get("buckets", {}).get(period, {}))
+        stats._recent = {day: tuple(c) for day, c in data.get("recent", {}).items()}
+        stats._start_sum = data.get("start_sum", 0)
+        stats._start_count = data.get("start_count", 0)
+        return stats
@@ -0,0 +1,117 @@
+"""
+Monotonic timer running coordinator jobs at wall-clock targets.
+"""
+
+import asyncio
+import logging
+
+from homeassistant.core import callback
+from homeassistant.util import dt as dt_util
+
+from .clock import SystemClock
+
+_LOGGER = logging.getLogger(__name__)
+
+# A timer firing earlier than this before its wall-clock target is re-armed
+MAX_EARLY_SECONDS = 1.0
+
+
+class RefreshTimer:
+    """Run a coroutine job at timezone-aware wall-clock targets.
+
+    The delay to the target is computed in UTC, so DST changes do not shift
+    it, and armed with ``loop.call_at`` on the monotonic clock. If the wall
+    clock was moved back while waiting, the timer fires early and is re-armed
+    for the remaining time. Jobs run as background tasks of the config entry,
+    so they are cancelled with it, and at most one job is pending or in
+    flight at any time: a target reached while the job is still running is
+    skipped, the running job is expected to schedule its successor.
+    """
+
+    def __init__(self, hass, entry, name, job, on_fire=None, clock=None):
+        """Initialize the timer for ``job``, a coroutine function without arguments.
+
+        ``on_fire`` is called whenever the timer starts the job, not for skipped runs.
+        """
+        self._hass = hass
+        self._clock = clock or SystemClock()
+        self._entry = entry
+        self._name = name
+        self._job = job
+        self._on_fire = on_fire
+        self._handle = None
+        self._task = None
+        self._target = None
+
+    @property
+    def target(self):
+        """Return the pending wall-clock target, None if nothing is scheduled."""
+        return self._target if self._handle else None
+
+    @property
+    def running(self):
+        """Return True if the job is in flight."""
+        return self._task is not None and not self._task.done()
+
+    @callback
+    def schedule(self, target):
+        """Run the job at ``target``, replacing any pending target."""
+        self.cancel()
+        self._target = target
+        self._arm()
+
+    @callback
+    def _arm(self):
+        """Arm the monotonic call for the current target."""
+        delay = max(0.0, (dt_util.as_utc(self._target) - dt_util.as_utc(self._clock.now())).total_seconds())
+        self._handle = self._hass.loop.call_at(self._hass.loop.time() + delay, self._fire)
+        _LOGGER.debug(f"OreFree {self._name} timer armed for {self._target} (in {delay:.1f} seconds)")
+
+    @callback
+    def _fire(self):
+        """Start the job once the wall clock reached the target."""
+        self._handle = None
+        remaining = (dt_util.as_utc(self._target) - dt_util.as_utc(self._clock.now())).total_seconds()
+        if remaining > MAX_EARLY_SECONDS:
+            _LOGGER.debug(f"OreFree {self._name} timer fired {remaining:.1f} seconds early, re-arming")
+            self._arm()
+            return
+
+        if self.running:
+            _LOGGER.warning(f"OreFree {self._name} still running at {self._target}, skipping this run")
+            return
+        if self._on_fire:
+            self._on_fire()
+        self._start()
+
+    @callback
+    def _start(self):
+        """Start the job as a background task of the config entry."""
+        self._task = self._entry.async_create_background_task(
+            self._hass, self._job(), f"orefree {self._name} {self._entry.entry_id}"
+        )
+
+    async def async_run_now(self):
+        """Run the job now, or join the run already in flight, and wait for it."""
+        self.cancel()
+        if not self.running:
+            self._start()
+        await asyncio.shield(self._task)
+
+    @callback
+    def cancel(self):
+        """Cancel the pending target, a job in flight keeps running."""
+        if self._handle:
+            self._handle.cancel()
+            self._handle = None
+
+    async def async_shutdown(self):
+        """Cancel the pending target and the job in flight."""
+        self.cancel()
+        if self.running:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+        self._task = None
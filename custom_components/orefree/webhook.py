@@ -0,0 +1,59 @@
+"""
+Webhook receiver for OreFree schedules pushed by the scraper add-on.
+"""
+
+import logging
+from json import JSONDecodeError
+
+from aiohttp import web
+from homeassistant.components import webhook
+from homeassistant.const import CONF_WEBHOOK_ID
+
+from .const import DOMAIN
+
+_LOGGER = logging.getLogger(__name__)
+
+
+def async_register_webhook(hass, entry, coordinator):
+    """Register the push webhook of a config entry."""
+    webhook_id = entry.data[CONF_WEBHOOK_ID]
+
+    async def handle_webhook(hass, webhook_id, request):
+        """Feed a pushed schedule into the coordinator."""
+        return await _async_handle_push(coordinator, request)
+
+    webhook.async_register(
+        hass,
+        DOMAIN,
+        f"OreFree {entry.title}",
+        webhook_id,
+        handle_webhook,
+        local_only=True,
+        allowed_methods=["POST"],
+    )
+    _LOGGER.info(f"OreFree push webhook registered at {webhook.async_generate_path(webhook_id)}")
+
+
+def async_unregister_webhook(hass, entry):
+    """Unregister the push webhook of a config entry."""
+    webhook.async_unregister(hass, entry.data[CONF_WEBHOOK_ID])
+
+
+async def _async_handle_push(coordinator, request):
+    """Parse a pushed payload, either JSON {"text": "HH:MM-HH:MM"} or a plain text body."""
+    if request.content_type == "application/json":
+        try:
+            payload = await request.json()
+        except (JSONDecodeError, ValueError):
+            return web.Response(status=400, text="Invalid JSON body")
+        text = payload.get("text") if isinstance(payload, dict) else None
+    else:
+        text = await request.text()
+
+    if not isinstance(text, str) or not text.strip():
+        return web.Response(status=400, text="Missing schedule text")
+
+    _LOGGER.debug(f"Received pushed orefree schedule: {text}")
+    if not await coordinator.async_handle_push(text.strip()):
+        return web.Response(status=400, text="Invalid schedule, expected HH:MM-HH:MM for today")
+    return web.Response(status=200, text="OK")